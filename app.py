@@ -1,70 +1,519 @@
 import os
+import re
 import json
+import uuid
+import asyncio
+import hashlib
+import importlib
+import multiprocessing
+import shutil
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import islice
 from datetime import datetime
 import csv
+import io
 from pathlib import Path
-from flask import Flask, request, jsonify, send_file, render_template
+from urllib.parse import quote
+from flask import Flask, request, jsonify, render_template, Response, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from werkzeug.utils import secure_filename
 import httpx
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI, APIConnectionError, InternalServerError, RateLimitError
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_random, retry_if_exception_type
 from pdf_abstract import process_path
 
+try:  # 語意快取為選用功能：需安裝 sentence-transformers 與 faiss
+    import numpy as np
+    import faiss
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson (faster encoding of large abstracts)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # 直接以 orjson 產生的 bytes 建立回應，省去 str 轉換
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
-# Setup upload folder
-UPLOAD_FOLDER = 'pdf_uploads'
-if not os.path.exists(UPLOAD_FOLDER):
-    os.makedirs(UPLOAD_FOLDER)
+# Setup upload folder（可用環境變數指定，例如 Linux 上的 /dev/shm/pdf_uploads 以 RAM 暫存上傳檔）
+UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER', 'pdf_uploads')
+Path(UPLOAD_FOLDER).mkdir(parents=True, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+UPLOAD_BUFFER_SIZE = 1 << 20
 
-def generate_keywords_with_llm(title, author, year, abstract, api_key):
-    """Uses an LLM to generate keywords from paper metadata."""
-    if not all([title, abstract, api_key]):
-        return "（資料不齊全，略過 AI 分析）"
-    
-    try:
-        prompt = f"""請根據以下論文資訊，分析並提取核心主題與目標的關鍵字。
+# 摘要 txt 輸出資料夾與 process_path 的固定參數（每個檔案都相同，只建立一次）
+# 重複上傳已由 PARSE_CACHE 處理；不使用 process_path 的磁碟快取，以免 .cache 中的檔案在長時間執行的服務上無限累積
+ABSTRACT_OUTPUT_DIR = Path('abstract_output')
+ABSTRACT_OUTPUT_DIR.mkdir(exist_ok=True)
+_PROCESS_KW = dict(output_dir=ABSTRACT_OUTPUT_DIR, recursive=False, verbose=False, very_verbose=False, to_csv=False, use_cache=False)
+
+# 同時進行中的 LLM 請求上限（避免觸發 API 速率限制）
+LLM_CONCURRENCY = 20
+# 題目或摘要讀取失敗時不呼叫 LLM，直接回傳此訊息
+SKIPPED_KEYWORDS = "（資料不齊全，略過 AI 分析）"
+# 每個 LLM 請求合併的論文篇數
+LLM_BATCH_SIZE = 8
+
+# 匯出 CSV 時每次送出的資料量，以及每批交給 writerows 的列數
+EXPORT_CHUNK_SIZE = 1 << 20
+EXPORT_ROWS_PER_BATCH = 256
+
+# 背景事件迴圈：所有 LLM 請求都在同一個 loop 上執行，AsyncOpenAI client 才能跨請求重用；
+# 第一次請求時才啟動，PDF 解析子行程匯入本模組時不會跟著建立執行緒
+_LOOP = None
+_LOOP_LOCK = threading.Lock()
+
+def _get_loop():
+    """Returns the background event loop, starting its thread on first use."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name='llm-event-loop', daemon=True).start()
+    return _LOOP
+
+# 單次 LLM 請求的逾時秒數，避免個別慢請求拖住整批
+LLM_TIMEOUT = 30.0
+
+# 所有 client 共用同一個連線池，重複請求可沿用既有的 TCP/TLS 連線（只在 _LOOP 上建立與存取）
+@lru_cache(maxsize=1)
+def _get_http_client():
+    return httpx.AsyncClient(
+        timeout=LLM_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+
+# 依 API Key 快取的 AsyncOpenAI client（只在 _LOOP 上存取）
+_OAI_CLIENTS = {}
+
+# 關鍵字快取：相同（或語意幾乎相同）的論文不再重複呼叫 LLM
+KEYWORD_CACHE_PATH = 'keyword_cache.db'
+SEMANTIC_MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+SEMANTIC_THRESHOLD = 0.95
+
+@lru_cache(maxsize=1)
+def _get_embedding_model():
+    return SentenceTransformer(SEMANTIC_MODEL_NAME)
+
+@lru_cache(maxsize=256)
+def _embed(text):
+    return _get_embedding_model().encode([text], normalize_embeddings=True).astype('float32')
+
+class KeywordCache:
+    """Caches generated keywords by (title, abstract).
+
+    Lookups try the exact key first; when sentence-transformers and faiss are
+    installed, paraphrased papers are also matched by cosine similarity.
+    """
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS keywords (key TEXT PRIMARY KEY, keywords TEXT NOT NULL, embedding BLOB)'
+        )
+        self._db.commit()
+        self._index = None
+        self._index_keys = []
+
+    @staticmethod
+    def _key(title, abstract):
+        return hashlib.blake2b((title + '|' + abstract[:2000]).encode('utf-8'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _text(title, abstract):
+        return title + '\n' + abstract[:2000]
+
+    def _semantic_index(self):
+        # 第一次使用時才載入既有向量，建立內積（向量已正規化，即餘弦相似度）索引
+        if self._index is None:
+            self._index = faiss.IndexFlatIP(_get_embedding_model().get_sentence_embedding_dimension())
+            rows = self._db.execute('SELECT key, embedding FROM keywords WHERE embedding IS NOT NULL').fetchall()
+            for key, blob in rows:
+                self._index.add(np.frombuffer(blob, dtype='float32').reshape(1, -1))
+                self._index_keys.append(key)
+        return self._index
+
+    def get(self, title, abstract):
+        """Returns the cached keywords, or None on a miss."""
+        key = self._key(title, abstract)
+        with self._lock:
+            row = self._db.execute('SELECT keywords FROM keywords WHERE key = ?', (key,)).fetchone()
+            if row is None and SentenceTransformer is not None:
+                index = self._semantic_index()
+                if index.ntotal:
+                    scores, ids = index.search(_embed(self._text(title, abstract)), 1)
+                    if scores[0][0] >= SEMANTIC_THRESHOLD:
+                        row = self._db.execute(
+                            'SELECT keywords FROM keywords WHERE key = ?', (self._index_keys[ids[0][0]],)
+                        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, title, abstract, keywords):
+        """Stores keywords generated for the given paper."""
+        key = self._key(title, abstract)
+        vector = _embed(self._text(title, abstract)) if SentenceTransformer is not None else None
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO keywords (key, keywords, embedding) VALUES (?, ?, ?)',
+                (key, keywords, vector.tobytes() if vector is not None else None)
+            )
+            self._db.commit()
+            if vector is not None and self._index is not None and key not in self._index_keys:
+                self._index.add(vector)
+                self._index_keys.append(key)
+
+# 只在 _LOOP 上取得，第一次查詢時才開啟資料庫
+@lru_cache(maxsize=1)
+def _get_keyword_cache():
+    return KeywordCache(KEYWORD_CACHE_PATH)
+
+def _get_llm_client(api_key):
+    """Returns the cached AsyncOpenAI client for the given API key."""
+    client = _OAI_CLIENTS.get(api_key)
+    if client is None:
+        client = _OAI_CLIENTS.setdefault(api_key, AsyncOpenAI(
+            base_url="https://models.inference.ai.azure.com",
+            api_key=api_key,
+            http_client=_get_http_client(),
+            max_retries=0  # 重試統一交給 _call_llm 處理
+        ))
+    return client
+
+# 送進提示詞的欄位長度上限：關鍵字擷取只需摘要前段，較短的提示詞可降低 token 數與延遲
+PROMPT_TITLE_CHARS = 300
+PROMPT_ABSTRACT_CHARS = 1500
+# 關鍵字回答很短，每篇的輸出 token 上限
+KEYWORD_MAX_TOKENS = 120
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def _prep(s, n=PROMPT_ABSTRACT_CHARS):
+    """Collapses whitespace and truncates a prompt field to `n` characters."""
+    return _WHITESPACE_RE.sub(' ', s or '').strip()[:n]
+
+# 提示詞範本：靜態文字只在載入時建立一次，每篇論文只需 format 填入欄位
+_SYS = "你是一位專業的學術研究助理，擅長從論文資訊中精準提取核心主題與研究目標。"
+_SYS_MESSAGE = {"role": "system", "content": _SYS}
+
+_PROMPT = """請根據以下論文資訊，分析並提取核心主題與目標的關鍵字。
         
 論文資訊:
-題目: {title}
-作者: {author}
-年份: {year}
-摘要: {abstract}
+題目: {t}
+作者: {a}
+年份: {y}
+摘要: {ab}
 
 請以最簡潔的方式列出這篇論文的核心主題與目標，並僅使用中文頓號 (、) 分隔關鍵字。
 格式範例: \"主題1、主題2、主題3\"
 
 請直接回答關鍵字，不要包含任何其他說明或前綴文字。"""
 
-        client = OpenAI(
-            base_url="https://models.inference.ai.azure.com",
-            api_key=api_key,
-            http_client=httpx.Client(proxies={})
-        )
-        
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "你是一位專業的學術研究助理，擅長從論文資訊中精準提取核心主題與研究目標。"},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=300
-        )
-        
-        return response.choices[0].message.content.strip()
-        
-    except Exception as e:
-        print(f"LLM API Call Error: {e}")
-        return f"（AI 分析失敗：{str(e)}）"
+_PAPER_SECTION = """--- PAPER {i} ---
+題目: {t}
+作者: {a}
+年份: {y}
+摘要: {ab}"""
+
+_BATCH_PROMPT = """請根據以下多篇論文資訊，分別分析並提取每篇論文核心主題與目標的關鍵字。
+
+{sections}
+
+請以最簡潔的方式列出每篇論文的核心主題與目標，並僅使用中文頓號 (、) 分隔關鍵字。
+請以 JSON 物件回答，格式: {{"results": [{{"i": 0, "keywords": "主題1、主題2、主題3"}}, ...]}}，其中 i 為 PAPER 編號。
+
+請直接回答 JSON，不要包含任何其他說明或前綴文字。"""
+
+# 暫時性錯誤（連線失敗/逾時、429、5xx）以指數退避加上隨機抖動重試；SDK 會把 httpx 例外包成這些型別。
+# 以 wait_exponential + wait_random 組合，不使用 wait_exponential_jitter：其 initial 參數在 tenacity 9 已棄用，
+# 而替代的 multiplier 參數在 8.x 又不存在
+@retry(
+    stop=stop_after_attempt(4),
+    wait=wait_exponential(multiplier=0.5, max=8) + wait_random(0, 1),
+    retry=retry_if_exception_type((APIConnectionError, RateLimitError, InternalServerError)),
+    reraise=True
+)
+async def _call_llm(client, messages, **kwargs):
+    """Sends one chat completion request, retrying transient failures."""
+    return await client.chat.completions.create(model="gpt-4o", messages=messages, **kwargs)
+
+async def _request_keywords(client, title, author, year, abstract):
+    """Sends one paper to the LLM and returns its keywords."""
+    title = _prep(title, PROMPT_TITLE_CHARS)
+    abstract = _prep(abstract)
+    prompt = _PROMPT.format(t=title, a=author, y=year, ab=abstract)
+
+    response = await _call_llm(
+        client,
+        [_SYS_MESSAGE, {"role": "user", "content": prompt}],
+        temperature=0.7,
+        max_tokens=KEYWORD_MAX_TOKENS
+    )
+    
+    return response.choices[0].message.content.strip()
+
+async def _request_keywords_batch(client, papers):
+    """Sends several papers in one LLM request; returns keywords aligned with `papers`.
+
+    Papers missing from the model's answer come back as None.
+    """
+    sections = "\n\n".join(
+        _PAPER_SECTION.format(i=i, t=_prep(title, PROMPT_TITLE_CHARS), a=author, y=year, ab=_prep(abstract))
+        for i, (title, author, year, abstract) in enumerate(papers)
+    )
+    prompt = _BATCH_PROMPT.format(sections=sections)
+
+    response = await _call_llm(
+        client,
+        [_SYS_MESSAGE, {"role": "user", "content": prompt}],
+        temperature=0.7,
+        max_tokens=KEYWORD_MAX_TOKENS * len(papers),
+        response_format={"type": "json_object"}
+    )
+
+    keywords = [None] * len(papers)
+    for item in orjson.loads(response.choices[0].message.content).get('results', []):
+        i = item.get('i')
+        if isinstance(i, int) and 0 <= i < len(papers) and item.get('keywords'):
+            keywords[i] = str(item['keywords']).strip()
+    return keywords
+
+async def generate_keywords_batch(items, api_key, chunk=LLM_BATCH_SIZE):
+    """Generates keywords for many papers, packing up to `chunk` papers per LLM request.
+
+    `items` are (title, author, year, abstract) tuples; the result list keeps their order.
+    """
+    results = [None] * len(items)
+    pending = []
+    cache = _get_keyword_cache()
+    for i, (title, author, year, abstract) in enumerate(items):
+        if not all([title, abstract, api_key]):
+            results[i] = SKIPPED_KEYWORDS
+            continue
+        # 快取查詢涉及 sqlite 與（選用的）向量運算，移出事件迴圈執行
+        cached = await asyncio.to_thread(cache.get, title, abstract)
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.append(i)
+    if not pending:
+        return results
+
+    client = _get_llm_client(api_key)
+    semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+
+    async def run(indices):
+        papers = [items[i] for i in indices]
+        async with semaphore:
+            try:
+                # 單篇沿用原本的提示詞；多篇則合併為一個請求並要求 JSON 回覆
+                if len(papers) == 1:
+                    keywords = [await _request_keywords(client, *papers[0])]
+                else:
+                    keywords = await _request_keywords_batch(client, papers)
+            except Exception as e:
+                print(f"LLM API Call Error: {e}")
+                for i in indices:
+                    results[i] = f"（AI 分析失敗：{str(e)}）"
+                return
+        for i, kw in zip(indices, keywords):
+            if kw is None:
+                results[i] = "（AI 分析失敗：回應中缺少這篇論文的結果）"
+                continue
+            results[i] = kw
+            await asyncio.to_thread(cache.put, items[i][0], items[i][3], kw)
+
+    await asyncio.gather(*[run(pending[k:k + chunk]) for k in range(0, len(pending), chunk)])
+    return results
 
 @app.route('/')
 def index():
     """Serves the main page."""
     return render_template('index.html')
 
+class _LRUCache:
+    """A small thread-safe LRU mapping."""
+
+    def __init__(self, maxsize):
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+# 常駐的 PDF 解析行程池：PyMuPDF 解析為 CPU 密集工作，交給子行程並行且不佔用 web worker；
+# 子行程啟動時先載入 pdf_abstract（含 PyMuPDF），第一份檔案就不必再付匯入成本。
+# 子行程於事件迴圈與請求執行緒都已啟動後才建立，不可直接 fork 多執行緒的 web 行程：
+# 可用時使用 forkserver，否則（Windows）使用 spawn。
+# forkserver 預設會預先匯入 __main__（即整個 app），改為只預先匯入 pdf_abstract；
+# spawn 與 forkserver 的子行程仍會以 __mp_main__ 匯入本模組，因此事件迴圈、HTTP client、
+# 關鍵字快取與行程池都延後到第一次使用時才建立，子行程不會執行這些初始化。
+if 'forkserver' in multiprocessing.get_all_start_methods():
+    _PDF_POOL_CONTEXT = multiprocessing.get_context('forkserver')
+    _PDF_POOL_CONTEXT.set_forkserver_preload(['pdf_abstract'])
+else:
+    _PDF_POOL_CONTEXT = multiprocessing.get_context('spawn')
+_PDF_POOL_LOCK = threading.Lock()
+
+# 行程池大小：可用環境變數 PDF_POOL_WORKERS 指定；預設將 CPU 核心平均分給各 web worker。
+# gunicorn 的每個 worker 各有一個 PDF_POOL，WEB_CONCURRENCY（gunicorn 未指定 -w 時的 worker 數）
+# 亦用來推算預設值，避免 N 個 web worker 各開 N-1 個 PyMuPDF 行程
+WEB_CONCURRENCY = max(1, int(os.environ.get('WEB_CONCURRENCY', 1)))
+PDF_POOL_WORKERS = int(os.environ.get('PDF_POOL_WORKERS', 0)) or max(1, ((os.cpu_count() or 4) - 1) // WEB_CONCURRENCY)
+
+def _new_pdf_pool():
+    return ProcessPoolExecutor(
+        max_workers=PDF_POOL_WORKERS,
+        mp_context=_PDF_POOL_CONTEXT,
+        initializer=importlib.import_module,
+        initargs=('pdf_abstract',)
+    )
+
+PDF_POOL = None
+
+def _get_pdf_pool():
+    """Returns PDF_POOL, creating it on first use."""
+    global PDF_POOL
+    with _PDF_POOL_LOCK:
+        if PDF_POOL is None:
+            PDF_POOL = _new_pdf_pool()
+        return PDF_POOL
+
+def _parse_pdf(filepath):
+    """Runs process_path on PDF_POOL, replacing the pool if a worker has died."""
+    global PDF_POOL
+    pool = _get_pdf_pool()
+    try:
+        return pool.submit(process_path, filepath, **_PROCESS_KW).result()
+    except BrokenProcessPool:
+        # 子行程異常終止（例如 MuPDF 當機）會使整個行程池失效；重建後之後的請求即可繼續處理
+        with _PDF_POOL_LOCK:
+            if PDF_POOL is pool:
+                PDF_POOL = _new_pdf_pool()
+                pool.shutdown(wait=False)
+        raise
+
+# PDF 解析結果快取：重複上傳同一檔案時略過存檔與解析
+PARSE_CACHE_SIZE = 256
+PARSE_CACHE = _LRUCache(PARSE_CACHE_SIZE)
+
+def _upload_digest(filename, stream):
+    """Hashes the upload name and content; the stream is rewound afterwards."""
+    # 題目會由檔名推斷，因此檔名也是快取鍵的一部分
+    h = hashlib.blake2b(filename.encode('utf-8'), digest_size=16)
+    for chunk in iter(lambda: stream.read(UPLOAD_BUFFER_SIZE), b''):
+        h.update(chunk)
+    stream.seek(0)
+    return h.hexdigest()
+
+# 檔名中不允許的字元：控制字元與 Windows 保留字元（路徑分隔符號已先以 basename 去除）
+_UNSAFE_FILENAME_RE = re.compile(r'[\x00-\x1f\x7f<>:"/\\|?*]')
+# 多數檔案系統的檔名上限為 255 bytes
+MAX_FILENAME_BYTES = 255
+# Windows 的保留裝置名稱（不分大小寫、不論副檔名），與 werkzeug 相同加上底線前綴
+_WINDOWS_DEVICE_NAMES = frozenset(
+    ['CON', 'PRN', 'AUX', 'NUL'] + [f'{p}{i}' for p in ('COM', 'LPT') for i in range(1, 10)]
+)
+
+def _safe_upload_name(filename):
+    """Normalizes a client-supplied file name into a safe local PDF file name.
+
+    Unlike werkzeug's secure_filename, CJK characters are kept, since the
+    paper title is inferred from the file stem; Windows device names such as
+    CON or NUL are still prefixed with an underscore.
+    """
+    name = os.path.basename((filename or '').replace('\\', '/'))
+    name = _UNSAFE_FILENAME_RE.sub('', name).strip().lstrip('.')
+    stem, ext = os.path.splitext(name)
+    if not stem:
+        return f'upload_{uuid.uuid4().hex}.pdf'
+    if ext.lower() != '.pdf':
+        stem, ext = name, '.pdf'
+    if stem.split('.')[0].strip().upper() in _WINDOWS_DEVICE_NAMES:
+        stem = '_' + stem
+    stem = stem.encode('utf-8')[:MAX_FILENAME_BYTES - len(ext)].decode('utf-8', 'ignore').rstrip()
+    return stem + ext
+
+def _parse_upload(file):
+    """Saves one uploaded PDF and extracts its title, year, author and abstract."""
+    # 每個上傳檔案放在獨立的子資料夾，避免並行處理時同名檔案互相覆寫
+    filename = _safe_upload_name(file.filename)
+    digest = _upload_digest(filename, file.stream)
+    cached = PARSE_CACHE.get(digest)
+    if cached is not None:
+        return cached
+
+    # 暫存資料夾在解析完成後即刪除，上傳檔不會持續累積（UPLOAD_FOLDER 可能位於 /dev/shm）
+    with tempfile.TemporaryDirectory(dir=app.config['UPLOAD_FOLDER']) as upload_dir:
+        filepath = Path(upload_dir) / filename
+        # 以 1 MiB 區塊寫出（Werkzeug 的 file.save 預設僅 16 KiB）
+        with open(filepath, 'wb', buffering=UPLOAD_BUFFER_SIZE) as out:
+            shutil.copyfileobj(file.stream, out, length=UPLOAD_BUFFER_SIZE)
+
+        success, title, year, author, abstract = _parse_pdf(filepath)
+    result = (title, year, author, abstract)
+    # 只快取成功擷取出摘要的結果：解析錯誤（例如子行程異常終止）可能是暫時性的，重新上傳時應再解析一次
+    if success:
+        PARSE_CACHE.put(digest, result)
+    return result
+
+async def _process_files(files, api_key):
+    """Parses all uploaded PDFs, then generates keywords in batched LLM requests."""
+    # 存檔在執行緒中進行、解析交給 PDF_POOL；全部完成後再一次送出（分批合併的）LLM 請求
+    parsed = await asyncio.gather(*[asyncio.to_thread(_parse_upload, f) for f in files])
+
+    # 題目或摘要讀取失敗的檔案不進入快取查詢與 LLM 批次
+    keywords = [SKIPPED_KEYWORDS] * len(parsed)
+    complete = [i for i, (title, year, author, abstract) in enumerate(parsed) if title and abstract]
+    if complete:
+        generated = await generate_keywords_batch(
+            [(parsed[i][0], parsed[i][2], parsed[i][1], parsed[i][3]) for i in complete], api_key
+        )
+        for i, kw in zip(complete, generated):
+            keywords[i] = kw
+
+    return [
+        {
+            'title': title or '（標題讀取失敗）',
+            'author': author or '（作者讀取失敗）',
+            'year': year or '（年份讀取失敗）',
+            'abstract': abstract or '（摘要讀取失敗）',
+            'keywords': kw
+        }
+        for (title, year, author, abstract), kw in zip(parsed, keywords)
+    ]
+
 @app.route('/api/process_batch', methods=['POST'])
 def process_batch():
     """Handles the entire batch processing workflow."""
@@ -77,26 +526,10 @@ def process_batch():
         if not api_key:
             return jsonify({'success': False, 'error': '缺少 API Key'}), 400
 
-        all_records = []
-        for file in files:
-            if file:
-                filename = file.filename
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(filepath)
-
-                pdf_path = Path(filepath)
-                pdf_path = Path(filepath)
-                success, title, year, author , abstract = process_path(pdf_path,output_dir=Path('abstract_output'), recursive=False, verbose=False, very_verbose=False,to_csv=False)
-            
-                keywords = generate_keywords_with_llm(title, author, year, abstract, api_key)
-
-                all_records.append({
-                    'title': title or '（標題讀取失敗）',
-                    'author': author or '（作者讀取失敗）',
-                    'year': year or '（年份讀取失敗）',
-                    'abstract': abstract or '（摘要讀取失敗）',
-                    'keywords': keywords
-                })
+        files = [file for file in files if file]
+        # 交給背景事件迴圈：PDF 解析在執行緒中進行，所有 LLM 請求同時送出
+        future = asyncio.run_coroutine_threadsafe(_process_files(files, api_key), _get_loop())
+        all_records = future.result()
         
         return jsonify({'success': True, 'records': all_records})
 
@@ -106,42 +539,42 @@ def process_batch():
 
 @app.route('/api/export', methods=['POST'])
 def export_csv():
-    """Exports records to a CSV file."""
+    """Streams records to the client as a CSV file."""
     try:
         data = request.json
         if 'records' not in data or not data['records']:
             return jsonify({'success': False, 'error': '沒有資料可以匯出'}), 400
         
-        output_dir = 'output'
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'論文資料標籤_輸出_{timestamp}.csv'
-        filepath = os.path.join(output_dir, filename)
-        
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as csvfile:
-            fieldnames = ['題目', '作者', '年份', '摘要', '核心主題與目標']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for record in data['records']:
-                writer.writerow({
-                    '題目': record.get('title'),
-                    '作者': record.get('author'),
-                    '年份': record.get('year'),
-                    '摘要': record.get('abstract'),
-                    '核心主題與目標': record.get('keywords')
-                })
-        
-        return send_file(
-            filepath,
+
+        def generate(records):
+            # 在記憶體緩衝中累積約 1 MiB 再送出，不經過磁碟；開頭的 BOM 讓 Excel 正確辨識 UTF-8
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            buf.write('\ufeff')
+            writer.writerow(['題目', '作者', '年份', '摘要', '核心主題與目標'])
+            rows = (
+                (r.get('title'), r.get('author'), r.get('year'), r.get('abstract'), r.get('keywords'))
+                for r in records
+            )
+            # writerows 在 C 層迭代；每批寫完檢查一次緩衝大小
+            for batch in iter(lambda: list(islice(rows, EXPORT_ROWS_PER_BATCH)), []):
+                writer.writerows(batch)
+                if buf.tell() >= EXPORT_CHUNK_SIZE:
+                    yield buf.getvalue()
+                    buf.seek(0)
+                    buf.truncate()
+            yield buf.getvalue()
+
+        return Response(
+            stream_with_context(generate(data['records'])),
             mimetype='text/csv',
-            as_attachment=True,
-            download_name=filename
+            headers={'Content-Disposition': f"attachment; filename*=UTF-8''{quote(filename)}"}
         )
         
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # 開發用伺服器；正式部署請改用 wsgi.py（例如 gunicorn），讓多個使用者的批次可同時處理
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
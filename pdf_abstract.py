@@ -31,20 +31,31 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import sys
 from dataclasses import dataclass
 import csv
+import gc
+import hashlib
 import io
+import json
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
 
 try:
 	import fitz  # PyMuPDF
 except Exception as e:  # pragma: no cover - import error surfaced at runtime
 	fitz = None  # type: ignore
 
+try:
+	from tqdm import tqdm  # 選用：-v 批次處理時顯示進度列
+except Exception:  # pragma: no cover - optional dependency
+	tqdm = None  # type: ignore
+
 
 START_PATTERNS = [
 	# 起始樣式 1：單獨一行的 摘要/Abstract 標題
@@ -78,6 +89,29 @@ END_PATTERNS = [
 # Safety limit for maximum number of pages to include in abstract extraction
 MAX_ABSTRACT_PAGES = 3
 
+# 摘要起始標記只在文件前段尋找；超過此頁數仍未找到即放棄，不必擷取整份論文的文字
+MAX_START_SEARCH_PAGES = 15
+
+# 輸出 .txt 的 UTF-8 BOM 與段落分隔
+UTF8_BOM = b"\xef\xbb\xbf"
+_TXT_PARAGRAPH_SEP = os.linesep * 2
+TXT_BUFFER_SIZE = 1 << 16  # 單篇 txt 的寫入緩衝；BOM 與內文合併為一次寫出
+
+# 批次處理期間停用自動 GC，改為每處理這麼多個 PDF 手動回收一次
+GC_COLLECT_EVERY = 50
+
+# 彙整 CSV 的寫入緩衝大小；由檔案緩衝自行決定寫出時機，不另行手動 flush
+CSV_BUFFER_SIZE = 1 << 20
+
+# 擷取結果快取：<output-dir>/.cache/<檔名與 PDF 內容雜湊>.json；擷取規則變動時遞增版本以使舊快取失效
+CACHE_DIR_NAME = ".cache"
+CACHE_VERSION = 4
+
+_CJK = r"\u2E80-\u2FFF\u3000-\u303F\u31C0-\u31EF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF"  # 中日韓多區段
+# 於載入時編譯一次，供各擷取函式重複使用
+_CJK_RE = re.compile(f"[{_CJK}]")
+_HAS_CJK = _CJK_RE.search
+
 
 @dataclass
 class ExtractionResult:
@@ -90,41 +124,121 @@ class ExtractionResult:
 	reason: Optional[str] = None
 
 
+class PdfLineCache:
+	"""單一 PDF 的文字快取：文件只開啟一次，各頁文字行於首次使用時擷取並保留。
+
+	題目/年分/作者/摘要的擷取共用同一個快取，避免每個步驟都重新開檔與重跑 get_text。
+	可作為 context manager 使用，離開時關閉文件。
+	"""
+
+	def __init__(self, pdf_path: Path, data: Optional[bytes] = None):
+		if fitz is None:
+			raise RuntimeError(
+				"PyMuPDF (pymupdf) is not installed. Please install it: pip install pymupdf"
+			)
+		self.path = pdf_path
+		# 已讀入記憶體的檔案內容（例如計算雜湊時）可直接開啟，免去再讀一次磁碟
+		self.doc = fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(pdf_path)
+		# metadata（title/author/creation date 等）於開檔時讀取一次
+		self.metadata = dict(self.doc.metadata or {})
+		self._pages: dict = {}  # page_index -> List[str]
+		self._blocks: dict = {}  # page_index -> List[str]（文字區塊，僅供前段逐行讀取使用）
+		self._heads: dict = {}  # (n_pages, max_lines) -> List[str]
+
+	def __len__(self) -> int:
+		return len(self.doc)
+
+	def page_lines(self, i: int) -> List[str]:
+		"""回傳第 i 頁（0 起算）的文字行；首次呼叫時才擷取。"""
+		lines = self._pages.get(i)
+		if lines is None:
+			blocks = self._blocks.pop(i, None)
+			if blocks is not None:
+				text = "".join(blocks)  # 前段讀取時已取回的區塊，串接即為整頁文字
+			else:
+				text = self.doc[i].get_text("text")  # 以純文字方式取回（包含換行）
+			# Normalize Windows and Mac linebreaks just in case（PyMuPDF 一般只輸出 \n，僅在必要時替換）
+			if "\r" in text:
+				text = text.replace("\r\n", "\n").replace("\r", "\n")
+			# 移除行尾空白（摘要輸出依賴此處理）；保留行首縮排以利偵測標題格式
+			lines = [line.rstrip() for line in text.split("\n")]
+			self._pages[i] = lines
+		return lines
+
+	def _page_blocks(self, i: int) -> List[str]:
+		"""第 i 頁的文字區塊（略過影像區塊）；依原始順序串接等同 get_text("text")。"""
+		blocks = self._blocks.get(i)
+		if blocks is None:
+			blocks = [b[4] for b in self.doc[i].get_text("blocks") if b[6] == 0]
+			self._blocks[i] = blocks
+		return blocks
+
+	def iter_lines_limited(self, max_pages: int, max_lines: int) -> Iterable[Tuple[int, str]]:
+		"""逐區塊回傳前 max_pages 頁的 (page_index, line)，達 max_lines 行即停止。
+
+		只切分實際用到的區塊，不必為了前幾百行而切分整頁文字；
+		跨區塊的行會接回，結果與 page_lines 相同。
+		"""
+		count = 0
+		for i in range(min(max_pages, len(self.doc))):
+			if i in self._pages:
+				lines: Iterable[str] = self._pages[i]
+			else:
+				lines = self._iter_block_lines(i)
+			for line in lines:
+				yield i, line
+				count += 1
+				if count >= max_lines:
+					return
+
+	def _iter_block_lines(self, i: int) -> Iterable[str]:
+		pending = ""
+		for text in self._page_blocks(i):
+			if "\r" in text:
+				text = text.replace("\r\n", "\n").replace("\r", "\n")
+			parts = (pending + text).split("\n")
+			pending = parts.pop()
+			for line in parts:
+				yield line.rstrip()
+		yield pending.rstrip()
+
+	def iter_lines(self) -> Iterable[Tuple[int, str]]:
+		"""依序回傳 (page_index, line)。"""
+		for i in range(len(self.doc)):
+			for line in self.page_lines(i):
+				yield i, line
+
+	def first_n_page_lines(self, n_pages: int = 3, max_lines: int = 300) -> List[str]:
+		"""擷取前 n_pages 的文字行（合併），最多回傳 max_lines 行。
+
+		同一組 (n_pages, max_lines) 只組合一次（題目/年分/作者會重複要求前 3 頁與前 8 頁）；
+		回傳的串列為共用物件，呼叫端不應修改。
+		"""
+		key = (n_pages, max_lines)
+		out = self._heads.get(key)
+		if out is None:
+			out = [line for _, line in self.iter_lines_limited(n_pages, max_lines)]
+			self._heads[key] = out
+		return out
+
+	def close(self) -> None:
+		self.doc.close()
+
+	def __enter__(self) -> "PdfLineCache":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
+
 def iter_pdf_lines(pdf_path: Path) -> Iterable[Tuple[int, str]]:
 	"""以 PyMuPDF 讀取 PDF，每行回傳 (page_index, line)。
 
 	- page_index 為 0 起算。
 	- 盡量保留原始換行，利於後續以「行」為單位做模式偵測。
 	"""
-	if fitz is None:
-		raise RuntimeError(
-			"PyMuPDF (pymupdf) is not installed. Please install it: pip install pymupdf"
-		)
-	doc = fitz.open(pdf_path)
-	try:
-		for i in range(len(doc)):
-			page = doc[i]
-			text = page.get_text("text")  # 以純文字方式取回（包含換行）
-			# Normalize Windows and Mac linebreaks just in case
-			text = text.replace("\r\n", "\n").replace("\r", "\n")
-			for line in text.split("\n"):
-				# 移除行尾空白；保留行首縮排以利偵測標題格式
-				yield i, line.rstrip()
-	finally:
-		doc.close()
-
-
-def _get_pdf_metadata(pdf_path: Path) -> dict:
-	"""讀取 PDF 中的 metadata（title/author/creation date 等）。"""
-	if fitz is None:
-		raise RuntimeError(
-			"PyMuPDF (pymupdf) is not installed. Please install it: pip install pymupdf"
-		)
-	doc = fitz.open(pdf_path)
-	try:
-		return dict(doc.metadata or {})
-	finally:
-		doc.close()
+	with PdfLineCache(pdf_path) as cache:
+		yield from cache.iter_lines()
 
 
 def _sanitize_meta_value(value: Optional[str]) -> Optional[str]:
@@ -139,39 +253,63 @@ def _sanitize_meta_value(value: Optional[str]) -> Optional[str]:
 	return v
 
 
+_YEAR_RE = re.compile(r"\b((?:19|20)\d{2})\b")
+# 檔名尾端年份的三種格式合併為一個交替式：_YYYY / _YYYYMMDD / (YYYY)、[YYYY]、YYYY。
+# 三者皆以 $ 錨定，前者的命中位置一定在後者之前，因此最左匹配即等同依序嘗試的優先順序
+_YEAR_FN = re.compile(
+	r"(?:(?:_|\()(?P<a>(?:19|20)\d{2})(?:\d{4})?\)?$)"
+	r"|(?:\[(?P<b>(?:19|20)\d{2})\]$)"
+	r"|(?:(?P<c>(?:19|20)\d{2})$)"
+)
+
+
 def _parse_year_from_string(s: str) -> Optional[str]:
 	"""從字串找出 1900-2099 的西元年。回傳四位數字字串。"""
-	m = re.search(r"\b(19|20)(\d{2})\b", s)
+	m = _YEAR_RE.search(s)
 	if m:
-		return m.group(1) + m.group(2)
+		return m.group(1)
 	return None
 
 
 def _parse_year_from_filename(stem: str) -> Optional[str]:
 	# 常見格式：_YYYYMMDD 或 (YYYY) 或 [YYYY] 或 _YYYY
-	patterns = [
-		r"(?:_|\()((?:19|20)\d{2})(?:\d{4})?\)?$",
-		r"\[((?:19|20)\d{2})\]$",
-		r"((?:19|20)\d{2})$",
-	]
-	for p in patterns:
-		m = re.search(p, stem)
-		if m:
-			return m.group(1)
+	m = _YEAR_FN.search(stem)
+	if m:
+		return m.group("a") or m.group("b") or m.group("c")
 	# 任意位置的第一個四位年份
 	return _parse_year_from_string(stem)
 
 
+# 檔名中的目錄型前綴（基礎1_ / 標準10_ / 查詢3_）與尾端日期/年份（_20220219 / _2022）
+_RE_FN_PREFIX = re.compile(r"^(?:基礎|標準|查詢)\d+_")
+_RE_FN_DATE_SUFFIX = re.compile(r"_(?:19|20)\d{2}(?:\d{4})?$")
+# 看似期刊代碼/DOI 片段的檔名
+_RE_FN_CODE = re.compile(r"[A-Za-z0-9_.-]{1,30}")
+
+
 def _parse_title_from_filename(stem: str) -> str:
 	# 去除前綴如 基礎1_ / 標準10_ / 查詢3_ 等目錄型標籤
-	s = re.sub(r"^(?:基礎|標準|查詢)\d+_", "", stem)
+	s = _RE_FN_PREFIX.sub("", stem)
 	# 去除尾端日期/年份如 _20220219 或 _2022
-	s = re.sub(r"_(?:19|20)\d{2}(?:\d{4})?$", "", s)
+	s = _RE_FN_DATE_SUFFIX.sub("", s)
 	# 將底線移除（檔名分隔符），避免影響中文字間距
 	s = s.replace("_", "")
 	return s.strip()
 
 
+# 題目正規化與中英混排空白處理所用的樣式（載入時編譯一次）
+_RE_NEWLINES = re.compile(r"[\r\n]+")
+_RE_TITLE_SUFFIX = re.compile(r"[\s\-_/·]*\(?(?:最終版|最終|定稿|定版|final|FINAL|Final|修訂版|修正版|v\d{1,3})\)?\s*$")
+_RE_CJK_DASH_L = re.compile(fr"([{_CJK}])\s*-\s*")
+_RE_CJK_DASH_R = re.compile(fr"\s*-\s*([{_CJK}])")
+_RE_MULTISPACE = re.compile(r"\s{2,}")
+_RE_CJK_ASCII_INS1 = re.compile(fr"([{_CJK}])([A-Za-z0-9])")
+_RE_CJK_ASCII_INS2 = re.compile(fr"([A-Za-z0-9])([{_CJK}])")
+_RE_INLINE_MULTISPACE = re.compile(r"[\t ]{2,}")
+_RE_CJK_ASCII_RM1 = re.compile(fr"([{_CJK}])[\t ]+([A-Za-z0-9])")
+_RE_CJK_ASCII_RM2 = re.compile(fr"([A-Za-z0-9])[\t ]+([{_CJK}])")
+
+
 def _normalize_title(title: str) -> str:
 	"""標題正規化：
 	- 移除檔名常見的末尾標記：最終版/定稿/final/版本號等
@@ -180,57 +318,55 @@ def _normalize_title(title: str) -> str:
 	"""
 	t = title.strip()
 	# 將內部換行轉為空白，避免題目被分成多行
-	t = re.sub(r"[\r\n]+", " ", t)
+	t = _RE_NEWLINES.sub(" ", t)
 	# 去除尾綴：最終版/定稿/final 及版本號
-	t = re.sub(r"[\s\-_/·]*\(?(?:最終版|最終|定稿|定版|final|FINAL|Final|修訂版|修正版|v\d{1,3})\)?\s*$", "", t)
+	t = _RE_TITLE_SUFFIX.sub("", t)
 	# 去除 CJK 與 ASCII 之間僅作分隔的連字號（不影響英文詞內的連字號）
-	t = re.sub(fr"([{_CJK}])\s*-\s*", r"\1", t)
-	t = re.sub(fr"\s*-\s*([{_CJK}])", r"\1", t)
+	t = _RE_CJK_DASH_L.sub(r"\1", t)
+	t = _RE_CJK_DASH_R.sub(r"\1", t)
 	# 在 CJK 與 ASCII/數字 之間插入單一空白，提升可讀性
 	t = _normalize_cjk_ascii_spacing(t, mode="insert")
 	# 收斂多重空白
-	t = re.sub(r"\s{2,}", " ", t)
+	t = _RE_MULTISPACE.sub(" ", t)
 	return t
 
 
-def _first_n_page_lines(pdf_path: Path, n_pages: int = 3, max_lines: int = 300) -> List[str]:
+def _first_n_page_lines(cache: PdfLineCache, n_pages: int = 3, max_lines: int = 300) -> List[str]:
 	"""擷取前 n_pages 的文字行（合併），最多回傳 max_lines 行。"""
-	out: List[str] = []
-	for pg, line in iter_pdf_lines(pdf_path):
-		if pg >= n_pages:
-			break
-		out.append(line)
-		if len(out) >= max_lines:
-			break
-	return out
+	return cache.first_n_page_lines(n_pages, max_lines)
 
 
 def _has_cjk(text: str) -> bool:
 	"""檢查字串是否包含中日韓文字。"""
-	return re.search(f"[{_CJK}]", text) is not None
+	return _HAS_CJK(text) is not None
+
+
+_ABS_HEADER_RE = re.compile(r"^(?:Abstract|ABSTRACT)\b\s*:?.*$", re.IGNORECASE)
 
 
 def _find_abstract_header_index(lines: List[str]) -> Optional[int]:
 	"""在行列中尋找 'Abstract' 標題所在的索引。大小寫不敏感。"""
+	match = _ABS_HEADER_RE.match
 	for i, ln in enumerate(lines):
-		s = ln.strip()
-		if re.match(r"^(?:Abstract|ABSTRACT)\b\s*:?.*$", s, re.IGNORECASE):
+		if match(ln.strip()):
 			return i
 	return None
 
 
+_AFFILIATION_RE = re.compile("|".join([
+	r"@", r"Department", r"School", r"University", r"College", r"Faculty",
+	r"Institute", r"Laborator(?:y|ies)", r"Centre|Center", r"Affiliation",
+	r"Corresponding\s+author", r"Article\s+history", r"Received", r"Accepted",
+	r"Published", r"ORCID", r"Keywords?", r"KEYWORDS", r"Index\s+Terms",
+]), re.IGNORECASE)
+
+
 def _looks_like_affiliation(line: str) -> bool:
 	"""粗略判斷是否為作者單位/聯絡資訊行，以排除在英文題目擷取中誤納。"""
 	s = line.strip()
 	if not s:
 		return True  # 空行視為分隔
-	patterns = [
-		r"@", r"Department", r"School", r"University", r"College", r"Faculty",
-		r"Institute", r"Laborator(?:y|ies)", r"Centre|Center", r"Affiliation",
-		r"Corresponding\s+author", r"Article\s+history", r"Received", r"Accepted",
-		r"Published", r"ORCID", r"Keywords?", r"KEYWORDS", r"Index\s+Terms",
-	]
-	if re.search("|".join(patterns), s, re.IGNORECASE):
+	if _AFFILIATION_RE.search(s):
 		return True
 	# 多個逗號的小短行，常見於作者列表或單位地址
 	if s.count(",") >= 2 and len(s) <= 120:
@@ -241,15 +377,15 @@ def _looks_like_affiliation(line: str) -> bool:
 	return False
 
 
-def _extract_english_title_from_lines(lines: List[str]) -> Optional[str]:
+def _extract_english_title_from_lines(lines: List[str], abs_idx: Optional[int]) -> Optional[str]:
 	"""嘗試於英文論文中，在 'Abstract' 之前擷取多行標題並串接為單行。
 
 	策略：自文件開頭至 Abstract 標題之前，挑選前段連續且不像作者/單位的行，
 	取 1~4 行合併為題目；合併時以空白連接並清理多餘空白與連字號換行。
+	abs_idx 為 Abstract 標題在 lines 中的索引（見 _find_abstract_header_index），由呼叫端計算一次。
 	"""
 	# 限制於前兩頁的內容
 	head = lines[:200]
-	abs_idx = _find_abstract_header_index(head)
 	if abs_idx is None:
 		window = head
 	else:
@@ -289,14 +425,32 @@ def _extract_english_title_from_lines(lines: List[str]) -> Optional[str]:
 			merged.append(ln)
 	title = " ".join(merged)
 	# 清理多重空白
-	title = re.sub(r"\s{2,}", " ", title).strip()
+	title = _RE_MULTISPACE.sub(" ", title).strip()
 	# 題目基本合理性檢查
 	if len(title) < 15 or len(title.split()) < 4:
 		return None
 	return title
 
 
-def _extract_chinese_title_from_lines(lines: List[str]) -> Optional[str]:
+# 題目候選的過濾條件：頁面標籤、敘述性開頭、句內標點
+_TITLE_DENY = r"(大學|學校|學院|系|所|研究所|學位|指導|導師|教授|學號|目錄|目次|致謝|誌謝|謝辭|關鍵字|关键词)"
+_TITLE_BAD_LEADING = r"(本研究|本文|本論文|因此|然而|在本研究中|在本論文中)"
+_TITLE_BAD_PUNCT = r"，。、；：！？()（）\[\]【】·"
+_TITLE_DENY_RE = re.compile(_TITLE_DENY)
+_TITLE_PUNCT_RE = re.compile(r"[，。、；：！？()（）\[\]【】·,.;:!]")
+# 兩個以上數字：與 str.isdigit 一致，除 \d 外另含上標/下標/圈號等數字符號（皆位於 Unicode 第 0、1 平面）
+_NON_DECIMAL_DIGITS = "".join(c for c in map(chr, range(0x80, 0x20000)) if c.isdigit() and not c.isdecimal())
+_RE_TWO_DIGITS = re.compile(fr"[\d{_NON_DECIMAL_DIGITS}].*?[\d{_NON_DECIMAL_DIGITS}]", re.DOTALL)
+# 中文題目行（已 strip）：含 CJK、非標籤、非敘述性開頭、無句內標點、末尾非冒號、長度 8~40；
+# 合併為單一 fullmatch，取代逐行多次 search/endswith
+_CN_TITLE_LINE = re.compile(
+	fr"(?=.*[{_CJK}])(?!.*{_TITLE_DENY})(?!{_TITLE_BAD_LEADING})"
+	fr"[^{_TITLE_BAD_PUNCT}]{{7,39}}[^{_TITLE_BAD_PUNCT}:]",
+	re.DOTALL,
+)
+
+
+def _extract_chinese_title_from_lines(lines: List[str], abs_idx: Optional[int]) -> Optional[str]:
 	"""在『摘要/Abstract』之前嘗試擷取中文題目。
 
 	策略：
@@ -306,7 +460,6 @@ def _extract_chinese_title_from_lines(lines: List[str]) -> Optional[str]:
 	- 選擇最像中文題目的那一行（包含 CJK、長度 8~40、少標點、末尾非句號/冒號）
 	"""
 	head = lines[:200]
-	abs_idx = _find_abstract_header_index(head)
 	window = head if abs_idx is None else head[:abs_idx]
 	# 進一步限制在文件最前面的一小段（多數題目位於開頭區域）
 	window = window[:120]
@@ -314,33 +467,15 @@ def _extract_chinese_title_from_lines(lines: List[str]) -> Optional[str]:
 	if not window:
 		return None
 
-	# 過濾非題目行
-	deny = re.compile(r"(大學|學校|學院|系|所|研究所|學位|指導|導師|教授|學號|目錄|目次|致謝|誌謝|謝辭|關鍵字|关键词)")
-	# 排除明顯的敘述性或非題目特徵
-	bad_leading = re.compile(r"^(本研究|本文|本論文|因此|然而|在本研究中|在本論文中)")
-	bad_punct = re.compile(r"[，。、；：！？()（）\[\]【】·]")
+	# 過濾非題目行、敘述性句子與長度不符者（見 _CN_TITLE_LINE）
+	match = _CN_TITLE_LINE.fullmatch
 	candidates: List[str] = []
 	for ln in window:
 		s = ln.strip()
-		if not s:
-			continue
-		# 必須含有 CJK
-		if not _has_cjk(s):
-			continue
-		# 過濾明顯非題目標籤
-		if deny.search(s):
+		if not match(s):
 			continue
-		# 排除以敘述性開頭
-		if bad_leading.search(s):
-			continue
-		# 排除包含明顯句內標點、或末尾為句號/冒號的行（較可能是段落句）
-		if bad_punct.search(s) or s.endswith("。") or s.endswith(":") or s.endswith("："):
-			continue
-		# 過於複雜（含數字過多）則排除
-		if sum(ch.isdigit() for ch in s) >= 2:
-			continue
-		# 長度範圍（避免過短/過長）
-		if not (8 <= len(s) <= 40):
+		# 過於複雜（含數字過多）則排除；第二個數字出現即停止比對
+		if _RE_TWO_DIGITS.search(s):
 			continue
 		candidates.append(s)
 
@@ -350,7 +485,14 @@ def _extract_chinese_title_from_lines(lines: List[str]) -> Optional[str]:
 	return max(candidates, key=len)
 
 
-def _expand_title_by_superstring(filename_title: str, lines: List[str]) -> Optional[str]:
+# _expand_title_by_superstring 比對用的正規化：去除空白與常見標點
+_CANON_WS = re.compile(r"[\s\u3000\t\r\n]")
+_CANON_PUNCT = re.compile(r"[，。、；：！？,.;:!()（）\[\]【】·、\-—_/|]+")
+# 次要路徑排除的摘要標題行
+_SUPERSTRING_ABS_HDR_RE = re.compile(r"^\s*(?:摘要|Abstract|ABSTRACT)\b")
+
+
+def _expand_title_by_superstring(filename_title: str, lines: List[str], abs_idx: Optional[int]) -> Optional[str]:
 	"""在『摘要/Abstract』之前，尋找包含檔名題目且更長的中文行，作為高可信度擴充題目。
 
 	規則：
@@ -366,28 +508,30 @@ def _expand_title_by_superstring(filename_title: str, lines: List[str]) -> Optio
 		return None
 
 	head = lines[:200]
-	abs_idx = _find_abstract_header_index(head)
 	window = head if abs_idx is None else head[:abs_idx]
 
 	def _canon(s: str) -> str:
 		# 去除空白與常見標點，便於子字串比對
-		t = re.sub(r"[\s\u3000\t\r\n]", "", s)
-		t = re.sub(r"[，。、；：！？,.;:!()（）\[\]【】·、\-—_/|]+", "", t)
-		return t
+		return _CANON_PUNCT.sub("", _CANON_WS.sub("", s))
 
 	base = filename_title.strip()
 	base_c = _canon(base)
 	if len(base_c) < 4:
 		return None
 
-	deny = re.compile(r"(大學|學校|學院|系|所|研究所|學位|指導|導師|教授|學號|目錄|目次|致謝|誌謝|謝辭|關鍵字|关键词)")
-	punct_pat = re.compile(r"[，。、；：！？()（）\[\]【】·,.;:!]")
+	deny = _TITLE_DENY_RE
+	punct_pat = _TITLE_PUNCT_RE
+
+	# 快速預篩：_canon 只會移除空白與標點，base_c 的首尾字元必定原樣出現在候選行中
+	first_c, last_c = base_c[0], base_c[-1]
 
 	candidates: List[str] = []
 	for ln in window:
 		s = ln.strip()
 		if not s:
 			continue
+		if first_c not in s or last_c not in s:
+			continue
 		if not _has_cjk(s):
 			continue
 		if deny.search(s):
@@ -414,12 +558,11 @@ def _expand_title_by_superstring(filename_title: str, lines: List[str]) -> Optio
 	# 次要路徑：若在 Abstract 前未找到，嘗試在文件開頭區域（前 ~120 行）搜尋一次
 	# 排除明顯摘要/關鍵字標題行，避免誤取段落句
 	window2 = head[:120]
-	start_hdr = re.compile(r"^\s*(?:摘要|Abstract|ABSTRACT)\b")
 	for ln in window2:
 		s = ln.strip()
-		if not s or not _has_cjk(s):
+		if not s or first_c not in s or last_c not in s or not _has_cjk(s):
 			continue
-		if start_hdr.search(s):
+		if _SUPERSTRING_ABS_HDR_RE.search(s):
 			continue
 		if deny.search(s):
 			continue
@@ -441,7 +584,12 @@ def _expand_title_by_superstring(filename_title: str, lines: List[str]) -> Optio
 	return max(candidates, key=len)
 
 
-def _expand_title_by_right_context(filename_title: str, lines: List[str]) -> Optional[str]:
+# 右側語境延伸時略過的空白與弱標點（逐字判斷），以及不可延伸進去的標籤行
+_RIGHT_CTX_SKIP = frozenset(" \t\r\n\u3000，,、()（）[]【】·-—_/|")
+_RIGHT_CTX_LABEL_RE = re.compile(r"(關鍵字|关键词|摘要|Abstract|ABSTRACT|目錄|目次)")
+
+
+def _expand_title_by_right_context(filename_title: str, lines: List[str], abs_idx: Optional[int]) -> Optional[str]:
 	"""當檔名題目略短時，嘗試在內文中以「右側語境」延伸題目。
 
 	策略：
@@ -456,7 +604,6 @@ def _expand_title_by_right_context(filename_title: str, lines: List[str]) -> Opt
 
 	# 僅取文件前段（2~3頁）作為搜尋範圍
 	head = lines[:300]
-	abs_idx = _find_abstract_header_index(head)
 	window = head if abs_idx is None else head[:abs_idx]
 	original = "\n".join(window)
 
@@ -465,10 +612,8 @@ def _expand_title_by_right_context(filename_title: str, lines: List[str]) -> Opt
 		out_chars: List[str] = []
 		mapping: List[int] = []
 		for i, ch in enumerate(s):
-			if ch in {" ", "\t", "\r", "\n", "\u3000"}:
-				continue
-			# 去除弱連接符與常見非終止標點，保留內容性字元以利匹配
-			if re.match(r"[，,、()（）\[\]【】·\-—_/|]", ch):
+			# 去除空白、弱連接符與常見非終止標點，保留內容性字元以利匹配
+			if ch in _RIGHT_CTX_SKIP:
 				continue
 			out_chars.append(ch)
 			mapping.append(i)
@@ -506,7 +651,7 @@ def _expand_title_by_right_context(filename_title: str, lines: List[str]) -> Opt
 			next_line = original[cur + 1:seg_end].strip()
 			if next_line and _has_cjk(next_line):
 				# 排除明顯標籤與句尾符號
-				if not re.search(r"(關鍵字|关键词|摘要|Abstract|ABSTRACT|目錄|目次)", next_line) and not next_line.endswith("。") and not next_line.endswith(":") and not next_line.endswith("："):
+				if not _RIGHT_CTX_LABEL_RE.search(next_line) and not next_line.endswith("。") and not next_line.endswith(":") and not next_line.endswith("："):
 					cur += 1
 					steps += 1
 					continue
@@ -526,13 +671,12 @@ def _expand_title_by_right_context(filename_title: str, lines: List[str]) -> Opt
 		candidate = candidate[:120].rstrip()
 
 	# 至少新增 2 個 CJK 字
-	extra_cjk = re.findall(f"[{_CJK}]", candidate[len(filename_title):])
+	extra_cjk = _CJK_RE.findall(candidate[len(filename_title):])
 	if len(extra_cjk) < 2:
 		return None
 
 	# 過濾常見頁面標籤
-	deny = re.compile(r"(大學|學校|學院|系|所|研究所|學位|指導|導師|教授|學號|目錄|目次|致謝|誌謝|謝辭|關鍵字|关键词)")
-	if deny.search(candidate):
+	if _TITLE_DENY_RE.search(candidate):
 		return None
 
 	return candidate
@@ -541,7 +685,6 @@ def _expand_title_by_right_context(filename_title: str, lines: List[str]) -> Opt
 AUTHOR_REGEXES = [
 	# 明確標籤行：『作者：』『作者』『研究生：』『學生：』『姓名：』『論文作者：』『作者姓名：』『畢業生：』等
 	re.compile(r"^\s*作者\s*[：:]\s*(?P<name>.+?)\s*$"),
-	re.compile(r"^\s*作者\s*[：:]?\s*$"),  # 下一行可能是姓名
 	re.compile(r"^\s*(?:研究生|研 究 生|學生|学生)\s*[：:]?\s*(?P<name>[\u4e00-\u9fffA-Za-z .・．。-]{2,})\s*$"),
 	re.compile(r"^\s*姓\s*名\s*[：:]?\s*(?P<name>[\u4e00-\u9fffA-Za-z .・．。-]{2,})\s*$"),
 	re.compile(r"^\s*(?:論文作者|作者姓名|畢業生)\s*[：:]?\s*(?P<name>[\u4e00-\u9fffA-Za-z .・．。-]{2,})\s*$"),
@@ -552,6 +695,17 @@ AUTHOR_REGEXES = [
 ]
 
 
+# 單獨成行的『作者』標題（下一行可能是姓名）
+_AUTHOR_HEADER_RE = re.compile(r"^\s*作者\s*[：:]?\s*$")
+
+# 單獨成行的 2~4 字中文姓名（可含一個空白），以及姓名附近常見的上下文
+_NAME_LIKE_RE = re.compile(r"^[\s　]*([\u4e00-\u9fff]{1,2})\s?([\u4e00-\u9fff]{1,2})[\s　]*$")
+_ADVISOR_CTX_RE = re.compile(r"(指導|導師|教授|Advisor|Supervisor)", re.IGNORECASE)
+_AUTHOR_CTX_HINT_RE = re.compile(r"(大學|學校|學院|系|所|研究所|學位|論文|指導|教授|學號)")
+# 指導教授附近的姓名候選若含這些詞則排除
+_ADVISOR_NAME_STOP_RE = re.compile("碩士|博士|論文|學位|學校|大學|學院|系|所|致謝|誌謝|謝辭")
+
+
 def _extract_author_from_lines(lines: List[str], verbose: bool = False) -> Optional[str]:
 	# 先看含有『作者』/『Author』關鍵詞的行（加大搜尋範圍以涵蓋封面/口試審查頁面）
 	for i, line in enumerate(lines[:200]):
@@ -566,7 +720,7 @@ def _extract_author_from_lines(lines: List[str], verbose: bool = False) -> Optio
 					print(f"[AUTHOR] Label match by /{rgx.pattern}/ at line {i+1}: '{name}'")
 				return name
 		# 形式：上一行為『作者』，下一行為姓名
-		if re.match(r"^\s*作者\s*[：:]?\s*$", line):
+		if _AUTHOR_HEADER_RE.match(line):
 			if i + 1 < len(lines):
 				nxt = lines[i + 1].strip()
 				if 1 < len(nxt) <= 30:
@@ -575,9 +729,8 @@ def _extract_author_from_lines(lines: List[str], verbose: bool = False) -> Optio
 					return nxt
 
 	# 結構性猜測：靠近『指導/教授/導師/Advisor/Supervisor』等關鍵上下文
-	name_like = re.compile(r"^[\s　]*([\u4e00-\u9fff]{1,2})\s?([\u4e00-\u9fff]{1,2})[\s　]*$")
-	ctx = re.compile(r"(指導|導師|教授|Advisor|Supervisor)", re.IGNORECASE)
-	stop = {"碩士", "博士", "論文", "學位", "學校", "大學", "學院", "系", "所", "致謝", "誌謝", "謝辭"}
+	name_like = _NAME_LIKE_RE
+	ctx = _ADVISOR_CTX_RE
 	for i, line in enumerate(lines[:200]):
 		if not ctx.search(line):
 			continue
@@ -589,7 +742,7 @@ def _extract_author_from_lines(lines: List[str], verbose: bool = False) -> Optio
 			m = name_like.match(s)
 			if m:
 				cand = (m.group(1) or "") + (m.group(2) or "")
-				if any(w in cand for w in stop):
+				if _ADVISOR_NAME_STOP_RE.search(cand):
 					continue
 				if verbose:
 					print(f"[AUTHOR] Structural fallback near advisor context (lines {i-3}..{i+3}): '{cand}'")
@@ -598,6 +751,28 @@ def _extract_author_from_lines(lines: List[str], verbose: bool = False) -> Optio
 	return None
 
 
+# 僅保留通用的論文/章節/角色用語，避免領域詞造成過擬合；不使用單字功能詞以免誤殺姓名
+AUTHOR_STOPWORDS = {
+	# 章節與結構
+	"摘要", "中文摘要", "英文摘要", "Abstract", "ABSTRACT",
+	"關鍵字", "关键词", "關鍵詞", "Keywords", "Index Terms",
+	"目錄", "目次", "附錄",
+	"引言", "緒論", "前言", "導論",
+	"參考文獻", "参考文献", "References",
+	"方法", "結果", "討論", "結論",
+	# 身分與標籤
+	"作者", "作者姓名", "論文作者", "姓名",
+	"研究生", "學生", "學生姓名",
+	"指導", "導師", "指導教授", "教授",
+	# 校系與學位
+	"大學", "學校", "學院", "系", "所", "研究所", "學位", "學程", "學號",
+	# 其他常見頁面/欄位
+	"致謝", "誌謝", "謝辭", "封面", "審定書", "口試委員", "委員"
+}
+# 候選姓名只要包含任一停用詞即排除；合併為單一 regex，一次 search 取代逐詞子字串比對
+_AUTHOR_STOP_RE = re.compile("|".join(map(re.escape, sorted(AUTHOR_STOPWORDS, key=len, reverse=True))))
+
+
 def _guess_author_from_lines(lines: List[str], title: Optional[str] = None, verbose: bool = False) -> Optional[str]:
 	"""在未找到帶有標籤的作者行時，嘗試從前幾十行中猜測姓名（2~4 個中文字）。
 
@@ -606,26 +781,8 @@ def _guess_author_from_lines(lines: List[str], title: Optional[str] = None, verb
 	- 若候選為題目片段則捨棄，避免將標題拆行的一部分誤判為作者。
 	- 優先挑選鄰近學校/系所/指導教授等上下文的候選。
 	"""
-	# 僅保留通用的論文/章節/角色用語，避免領域詞造成過擬合；不使用單字功能詞以免誤殺姓名
-	stopwords = {
-		# 章節與結構
-		"摘要", "中文摘要", "英文摘要", "Abstract", "ABSTRACT",
-		"關鍵字", "关键词", "關鍵詞", "Keywords", "Index Terms",
-		"目錄", "目次", "附錄",
-		"引言", "緒論", "前言", "導論",
-		"參考文獻", "参考文献", "References",
-		"方法", "結果", "討論", "結論",
-		# 身分與標籤
-		"作者", "作者姓名", "論文作者", "姓名",
-		"研究生", "學生", "學生姓名",
-		"指導", "導師", "指導教授", "教授",
-		# 校系與學位
-		"大學", "學校", "學院", "系", "所", "研究所", "學位", "學程", "學號",
-		# 其他常見頁面/欄位
-		"致謝", "誌謝", "謝辭", "封面", "審定書", "口試委員", "委員"
-	}
-	name_like = re.compile(r"^[\s　]*([\u4e00-\u9fff]{1,2})\s?([\u4e00-\u9fff]{1,2})[\s　]*$")
-	ctx_hint = re.compile(r"(大學|學校|學院|系|所|研究所|學位|論文|指導|教授|學號)")
+	name_like = _NAME_LIKE_RE
+	ctx_hint = _AUTHOR_CTX_HINT_RE
 	title_str = title or ""
 
 	near_ctx: List[str] = []
@@ -639,7 +796,7 @@ def _guess_author_from_lines(lines: List[str], title: Optional[str] = None, verb
 		if not m:
 			continue
 		cand = (m.group(1) or "") + (m.group(2) or "")
-		if any(w in cand for w in stopwords):
+		if _AUTHOR_STOP_RE.search(cand):
 			continue
 		if title_str and cand in title_str:
 			continue
@@ -660,9 +817,28 @@ def _guess_author_from_lines(lines: List[str], title: Optional[str] = None, verb
 	return None
 
 
-def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbose: bool = False) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-	"""擷取題目、年分、作者（盡力而為的啟發式）。"""
-	meta = _get_pdf_metadata(pdf_path)
+# metadata creationDate 中的年份（'D:YYYYMMDDHHmmss...'）
+_META_YEAR_RE = re.compile(r"(?:D:)?((?:19|20)\d{2})")
+# 作者後處理：「名 姓」形式的中文姓名，以及連續的中文片段
+_CJK_NAME_SPLIT_RE = re.compile(fr"^([{_CJK}]{{1,3}})\s+([{_CJK}]{{1,2}})$")
+_CJK_RUN_RE = re.compile(f"[{_CJK}]+")
+
+
+def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbose: bool = False, cache: Optional[PdfLineCache] = None, log: Callable[[str], None] = print) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+	"""擷取題目、年分、作者（盡力而為的啟發式）。
+
+	cache：可傳入已開啟的 PdfLineCache 與摘要擷取共用；未提供時自行開檔。
+	log：-v 單行作者摘要的輸出方式（預設直接 print）；批次處理時交給呼叫端與該檔其他訊息一併輸出。
+	"""
+	return _extract_title_year_author(pdf_path, verbose=verbose, very_verbose=very_verbose, cache=cache, log=log)[:3]
+
+
+def _extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbose: bool = False, cache: Optional[PdfLineCache] = None, log: Callable[[str], None] = print) -> Tuple[Optional[str], Optional[str], Optional[str], str]:
+	"""同 extract_title_year_author，另回傳作者來源（method），供擷取結果快取保存並於命中時重現 -v 的作者訊息。"""
+	if cache is None:
+		with PdfLineCache(pdf_path) as cache:
+			return _extract_title_year_author(pdf_path, verbose=verbose, very_verbose=very_verbose, cache=cache, log=log)
+	meta = cache.metadata
 	meta_title = _sanitize_meta_value(meta.get("title")) if meta else None
 	meta_author = _sanitize_meta_value(meta.get("author")) if meta else None
 	meta_creation = _sanitize_meta_value(meta.get("creationDate")) if meta else None
@@ -677,7 +853,7 @@ def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbos
 	# 可疑的檔名題目（例如期刊代碼/DOI 片段），偏好以內文推斷英文題目
 	fn_suspicious = (
 		not _has_cjk(filename_title)
-		and (re.fullmatch(r"[A-Za-z0-9_.-]{1,30}", pdf_path.stem) is not None)
+		and (_RE_FN_CODE.fullmatch(pdf_path.stem) is not None)
 	)
 
 	title: Optional[str]
@@ -685,12 +861,14 @@ def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbos
 		title = meta_title
 	else:
 		# 嘗試從前幾頁在 Abstract 之前擷取英文/中文題目，以及以檔名題目為錨點的擴充題目
-		lines = _first_n_page_lines(pdf_path, n_pages=5)
-		eng_title = _extract_english_title_from_lines(lines)
-		cn_title = _extract_chinese_title_from_lines(lines)
-		super_cn = _expand_title_by_superstring(filename_title, lines) if filename_title else None
+		lines = _first_n_page_lines(cache, n_pages=5)
+		# Abstract 標題位置只找一次（前 300 行）；只看前 200 行的函式以 head[:abs_idx] 截取，結果相同
+		abs_idx = _find_abstract_header_index(lines[:300])
+		eng_title = _extract_english_title_from_lines(lines, abs_idx)
+		cn_title = _extract_chinese_title_from_lines(lines, abs_idx)
+		super_cn = _expand_title_by_superstring(filename_title, lines, abs_idx) if filename_title else None
 		# 若未找到更長的上位字串，嘗試以右側語境延伸
-		right_cn = _expand_title_by_right_context(filename_title, lines) if (filename_title and not super_cn) else None
+		right_cn = _expand_title_by_right_context(filename_title, lines, abs_idx) if (filename_title and not super_cn) else None
 		if eng_title and (fn_suspicious or not filename_title):
 			title = eng_title
 		else:
@@ -708,7 +886,7 @@ def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbos
 	year = None
 	year = _parse_year_from_filename(pdf_path.stem)
 	if not year:
-		lines = _first_n_page_lines(pdf_path, n_pages=3)
+		lines = _first_n_page_lines(cache, n_pages=3)
 		for ln in lines:
 			y = _parse_year_from_string(ln)
 			if y:
@@ -716,13 +894,13 @@ def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbos
 				break
 	if not year and meta_creation:
 		# PyMuPDF 常見 creationDate 格式：'D:YYYYMMDDHHmmss...'
-		m = re.search(r"(?:D:)?((?:19|20)\d{2})", meta_creation)
+		m = _META_YEAR_RE.search(meta_creation)
 		if m:
 			year = m.group(1)
 
 	# 作者：優先從前幾頁文字擷取，其次 metadata（避免套版作者）
 	# 第一次以 3 頁範圍尋找，以避免誤抓太遠內容
-	lines = _first_n_page_lines(pdf_path, n_pages=3)
+	lines = _first_n_page_lines(cache, n_pages=3)
 	if very_verbose:
 		print("[AUTHOR] Scanning first 3 pages for labeled author...")
 	author = _extract_author_from_lines(lines, verbose=very_verbose)
@@ -738,7 +916,7 @@ def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbos
 	if not author:
 		if very_verbose:
 			print("[AUTHOR] Not found. Expanding search up to first 8 pages...")
-		lines_wide = _first_n_page_lines(pdf_path, n_pages=8, max_lines=800)
+		lines_wide = _first_n_page_lines(cache, n_pages=8, max_lines=800)
 		author = _extract_author_from_lines(lines_wide, verbose=very_verbose)
 		if author:
 			method = "label-8p"
@@ -751,7 +929,7 @@ def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbos
 	if author and not _has_cjk(author) and title and _has_cjk(title):
 		if very_verbose:
 			print(f"[AUTHOR] Current author '{author}' is ASCII-only; title is CJK. Attempting CJK override...")
-		lines_wide = _first_n_page_lines(pdf_path, n_pages=8, max_lines=800)
+		lines_wide = _first_n_page_lines(cache, n_pages=8, max_lines=800)
 		cjk_guess = _guess_author_from_lines(lines_wide, title=title, verbose=very_verbose)
 		if cjk_guess and _has_cjk(cjk_guess):
 			if very_verbose:
@@ -772,14 +950,14 @@ def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbos
 			return name
 		s = name.strip()
 		# 單一空白分隔且全為 CJK
-		m = re.match(fr"^([{_CJK}]{{1,3}})\s+([{_CJK}]{{1,2}})$", s)
+		m = _CJK_NAME_SPLIT_RE.match(s)
 		if m:
 			first, second = m.group(1), m.group(2)
 			# 若第二段為一字，極可能為姓氏，調整為 姓 + 名
 			if len(second) == 1:
 				return second + first
 		# 將內部多個空白收斂為單一空白
-		s = re.sub(r"\s{2,}", " ", s)
+		s = _RE_MULTISPACE.sub(" ", s)
 		return s
 
 	if author:
@@ -791,7 +969,7 @@ def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbos
 		else:
 			# 優先輸出中文姓名：若同時含中英文，僅保留中文部分
 			def _to_cjk_author(name: str) -> str:
-				parts = re.findall(f"[{_CJK}]+", name)
+				parts = _CJK_RUN_RE.findall(name)
 				if parts:
 					# 取最長的連續中文片段視為姓名
 					return max(parts, key=len)
@@ -801,44 +979,47 @@ def extract_title_year_author(pdf_path: Path, verbose: bool = False, very_verbos
 			author = _to_cjk_author(author)
 	# 單行摘要輸出（-v）：僅一行顯示作者與來源；-vv 顯示完整追蹤
 	if verbose:
-		print(f"[AUTHOR] {author or ''} ({method or 'n/a'})")
+		log(f"[AUTHOR] {author or ''} ({method or 'n/a'})")
 	if very_verbose:
 		print(f"[AUTHOR] Final author: '{author or ''}'")
 
-	return title, year, author
+	return title, year, author, method
+
 
+def compile_union(patterns: Sequence[str], prefix: str) -> re.Pattern[str]:
+	"""將多個樣式合併為單一具名分支的交替式，每行只需一次 search。
 
-def compile_patterns(patterns: Sequence[str]) -> List[re.Pattern[str]]:
-	return [re.compile(p, flags=re.IGNORECASE) for p in patterns]
+	第 i 個樣式包在 (?P<{prefix}{i}>...) 中，命中後以 m.lastgroup 得知是哪一個樣式；
+	樣式內的 inline 群組改名為 inline{i} 以免重名。所有樣式皆以 ^ 錨定，
+	交替式依序嘗試分支，結果與逐一比對各樣式相同。
+	"""
+	return re.compile(
+		"|".join(
+			f"(?P<{prefix}{i}>{p.replace('(?P<inline>', f'(?P<inline{i}>')})"
+			for i, p in enumerate(patterns)
+		),
+		flags=re.IGNORECASE,
+	)
 
 
-START_REGEXES = compile_patterns(START_PATTERNS)
-END_REGEXES = compile_patterns(END_PATTERNS)
+# 軟性結束：常見標題字眼（中/英，區分大小寫）；需已收集到一定行數才視為結束，見 extract_abstract_from_pdf
+# Typical patterns like "1. Introduction" already covered by END_PATTERNS; here we add small capsish words
+SOFT_END_PATTERNS = [
+	r"^\s*(?-i:(?:Abstract|ABSTRACT|Introduction|Conclusions?)\b)",
+	r"^\s*(?-i:(?:摘要|引言|結論|結語|緒論|關鍵字|目錄)\b)",
+]
 
+START_UNION = compile_union(START_PATTERNS, "s")
+# 硬性結束樣式在前、軟性標題字眼在後：皆以 ^ 錨定，兩者同時命中時取硬性結束
+END_UNION = compile_union(END_PATTERNS + SOFT_END_PATTERNS, "e")
+_N_HARD_END = len(END_PATTERNS)
 
-def _looks_like_header(line: str) -> bool:
-	"""判斷是否看起來像是章節標題（軟性結束條件）。
 
-	- 短行且大寫比例高的英文文字
-	- 常見標題字眼（中/英），或前綴是常見章節名稱
-	"""
+def _looks_like_caps_header(line: str) -> bool:
+	"""判斷是否為全英文且全為大寫的短行（例如章節標題），屬軟性結束條件。"""
 	s = line.strip()
-	if not s:
-		return False
-	# 全英文且幾乎全為大寫（例如章節標題）
-	if (
-		len(s) <= 60
-		and all(ord(ch) < 128 for ch in s)  # 僅限 ASCII，避免中英混合被誤判
-		and s.isupper()
-		and re.search(r"[A-Z]", s)
-	):
-		return True
-	# Typical patterns like "1. Introduction" already covered; here we add small capsish words
-	if re.match(r"^(?:Abstract|ABSTRACT|Introduction|Conclusions?)\b", s):
-		return True
-	if re.match(r"^(?:摘要|引言|結論|結語|緒論|關鍵字|目錄)\b", s):
-		return True
-	return False
+	# 僅限 ASCII，避免中英混合被誤判；ASCII 字串的 isupper 已隱含至少一個 A-Z
+	return len(s) <= 60 and s.isascii() and s.isupper()
 
 
 def _join_with_hyphen_fix(lines: List[str]) -> str:
@@ -847,18 +1028,23 @@ def _join_with_hyphen_fix(lines: List[str]) -> str:
 	規則：若上一行以 '-' 結尾，且下一行以小寫英文字母開頭，移除連字號並直接銜接；
 	其餘情況不進行合併，維持每行一換行，貼近原始排版與提供的答案格式。
 	"""
-	out: List[str] = []
+	# 單次輸出：上一行暫存在 pending，待確定下一行是否為連字號續行後才寫出，
+	# 不需反覆重建逐漸變長的合併字串
+	buf = io.StringIO()
+	pending: Optional[str] = None
 	for line in lines:
-		if out:
-			prev = out[-1]
-			if prev.endswith('-') and line and line[:1].islower():
-				out[-1] = prev[:-1] + line.lstrip()
+		if pending is not None:
+			if pending.endswith('-') and line and line[:1].islower():
+				# 續行以小寫字母開頭，lstrip 不會改變內容，直接接在去掉連字號的上一行之後
+				buf.write(pending[:-1])
+				pending = line
 				continue
-		out.append(line)
-	return "\n".join(out)
-
-
-_CJK = r"\u2E80-\u2FFF\u3000-\u303F\u31C0-\u31EF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF"  # 中日韓多區段
+			buf.write(pending)
+			buf.write("\n")
+		pending = line
+	if pending is not None:
+		buf.write(pending)
+	return buf.getvalue()
 
 
 def _normalize_cjk_ascii_spacing(text: str, mode: str) -> str:
@@ -873,29 +1059,39 @@ def _normalize_cjk_ascii_spacing(text: str, mode: str) -> str:
 		return text
 
 	if mode == "insert":
-		text = re.sub(fr"([{_CJK}])([A-Za-z0-9])", r"\1 \2", text)
-		text = re.sub(fr"([A-Za-z0-9])([{_CJK}])", r"\1 \2", text)
+		text = _RE_CJK_ASCII_INS1.sub(r"\1 \2", text)
+		text = _RE_CJK_ASCII_INS2.sub(r"\1 \2", text)
 		# 收斂多重空白為單一空白（不跨行）
-		text = re.sub(r"[\t ]{2,}", " ", text)
+		text = _RE_INLINE_MULTISPACE.sub(" ", text)
 		return text
 
 	if mode == "remove":
 		# CJK + 空白 + ASCII/數字 -> 直接相連
-		text = re.sub(fr"([{_CJK}])[\t ]+([A-Za-z0-9])", r"\1\2", text)
+		text = _RE_CJK_ASCII_RM1.sub(r"\1\2", text)
 		# ASCII/數字 + 空白 + CJK -> 直接相連
-		text = re.sub(fr"([A-Za-z0-9])[\t ]+([{_CJK}])", r"\1\2", text)
+		text = _RE_CJK_ASCII_RM2.sub(r"\1\2", text)
 		return text
 
 	return text
 
 
-def extract_abstract_from_pdf(pdf_path: Path, verbose: bool = False) -> ExtractionResult:
+# 連續三個以上換行（收斂為一個空行）
+_RE_BLANK_LINES = re.compile(r"\n{3,}")
+# 摘要結尾夾帶的頁碼（羅馬數字或 1~3 位數字）
+_ROMAN_PAGE_RE = re.compile(r"^[ivxlcdmIVXLCDM]{1,4}\.?$")
+_DIGIT_PAGE_RE = re.compile(r"^\d{1,3}$")
+
+
+def extract_abstract_from_pdf(pdf_path: Path, verbose: bool = False, cache: Optional[PdfLineCache] = None) -> ExtractionResult:
 	"""依啟發式規則，自 PDF 擷取摘要區段。
 
 	回傳 ExtractionResult：若成功，包含摘要文字與起訖頁、使用到的起訖模式；若失敗，於 reason 說明原因。
+	cache：可傳入已開啟的 PdfLineCache 與題目/作者擷取共用；未提供時自行開檔。
 	"""
-	lines: List[Tuple[int, str]] = list(iter_pdf_lines(pdf_path))
-	if not lines:
+	if cache is None:
+		with PdfLineCache(pdf_path) as cache:
+			return extract_abstract_from_pdf(pdf_path, verbose=verbose, cache=cache)
+	if len(cache) == 0:
 		return ExtractionResult(
 			abstract=None,
 			start_page=None,
@@ -905,116 +1101,113 @@ def extract_abstract_from_pdf(pdf_path: Path, verbose: bool = False) -> Extracti
 			reason="No text extracted",
 		)
 
-	# 1) 尋找摘要起始標記
-	start_idx: Optional[int] = None
+	# 單次串流掃描的狀態機：seeking 尋找起始標記，collecting 累積內容直到結束標記或頁數上限；
+	# 結束後即停止讀取，不必取出整份文件的文字
+	state = "seeking"
+
 	start_page: Optional[int] = None
 	start_marker: Optional[str] = None
-	inline_first: Optional[str] = None
-
-	for idx, (pg, line) in enumerate(lines):
-		for rgx in START_REGEXES:
-			m = rgx.search(line)
-			if m:
-				start_idx = idx
-				start_page = pg
-				start_marker = m.re.pattern
-				inline_first = m.groupdict().get("inline") if m.groupdict() else None
-				if verbose:
-					print(f"Start found on page {pg+1}: '{line.strip()[:80]}'")
-				break
-		if start_idx is not None:
-			break
-
-	if start_idx is None:
-		return ExtractionResult(
-			abstract=None,
-			start_page=None,
-			end_page=None,
-			start_marker=None,
-			end_marker=None,
-			reason="Start marker not found",
-		)
-
-	# 2) 自起點往後累積內容，直到遇到結束標記或頁數上限
 	collected: List[str] = []
-	if inline_first:
-		collected.append(inline_first.strip())
 
-	end_idx: Optional[int] = None
 	end_page: Optional[int] = None
 	end_marker: Optional[str] = None
+	max_end_pg = 0
+	last_pg = 0  # 最後一個已收集行的頁碼
+	done = False
 
-	start_pg = start_page if start_page is not None else 0
-	max_end_pg = start_pg + MAX_ABSTRACT_PAGES - 1
-
-	# 若起始行僅為標題（無內嵌內容），就從下一行開始蒐集；若有內嵌內容，已先加入 collected
-	cursor = start_idx + 1 if not inline_first or re.match(r"^\s*(?:Abstract|ABSTRACT|(?:中文)?摘要)\s*[：:]?\s*$", lines[start_idx][1], re.IGNORECASE) else start_idx + 1
-
-	for idx in range(cursor, len(lines)):
-		pg, line = lines[idx]
-
-	# 若超過頁數上限仍未遇到結束標記，則以頁數上限作為終止
-		if pg > max_end_pg:
-			end_idx = idx
-			end_page = lines[idx - 1][0] if idx > cursor else start_pg
+	pg = 0
+	for pg in range(len(cache)):
+		if state == "seeking" and pg >= MAX_START_SEARCH_PAGES:
+			break
+		# 若超過頁數上限仍未遇到結束標記，則以頁數上限作為終止；頁碼先行檢查，超出上限的頁面不必擷取文字
+		if state == "collecting" and pg > max_end_pg:
+			end_page = last_pg
 			end_marker = f"page_limit_{MAX_ABSTRACT_PAGES}"
 			if verbose:
 				print(f"Stopping at page limit after page {end_page+1}")
 			break
 
-	# 硬性結束標記：關鍵字、參考文獻、第一章標題等
-		for rgx in END_REGEXES:
-			if rgx.search(line):
-				end_idx = idx
+		for line in cache.page_lines(pg):
+			if state == "seeking":
+				# 1) 尋找摘要起始標記
+				m = START_UNION.search(line)
+				if not m:
+					continue
+				branch = int(m.lastgroup[1:])
+				start_page = pg
+				start_marker = START_PATTERNS[branch]
+				inline_first = m.groupdict().get(f"inline{branch}")
+				if verbose:
+					print(f"Start found on page {pg+1}: '{line.strip()[:80]}'")
+				# 2) 自起點往後累積內容；若有內嵌內容，先加入 collected，再從下一行開始蒐集
+				if inline_first:
+					collected.append(inline_first.strip())
+				max_end_pg = pg + MAX_ABSTRACT_PAGES - 1
+				last_pg = pg
+				state = "collecting"
+				continue
+
+			# 硬性結束標記：關鍵字、參考文獻、第一章標題等
+			m = END_UNION.search(line)
+			if m:
+				branch = int(m.lastgroup[1:])
+				if branch < _N_HARD_END:
+					end_page = pg
+					end_marker = END_PATTERNS[branch]
+					if verbose:
+						print(f"End found on page {pg+1}: '{line.strip()[:80]}'")
+					done = True
+					break
+
+			# 軟性結束：需已收集到一定行數（避免太早截斷），且該行疑似標題（命中軟性字眼或全大寫短行）
+			if len(collected) >= 5 and (m is not None or _looks_like_caps_header(line)):
 				end_page = pg
-				end_marker = rgx.pattern
+				end_marker = "soft_header"
 				if verbose:
-					print(f"End found on page {pg+1}: '{line.strip()[:80]}'")
+					print(f"Soft end at page {pg+1}: '{line.strip()[:80]}'")
+				done = True
 				break
-		if end_idx is not None:
-			break
 
-		# 軟性結束：需已收集到一定行數（避免太早截斷），且該行疑似標題
-		if len(collected) >= 5 and _looks_like_header(line):
-			end_idx = idx
-			end_page = pg
-			end_marker = "soft_header"
-			if verbose:
-				print(f"Soft end at page {pg+1}: '{line.strip()[:80]}'")
+			# 其他情況：持續加入行內容
+			collected.append(line)
+			last_pg = pg
+		if done:
 			break
+	else:
+		# 若始終未命中結束條件：文件已讀完，收集內容即到最後一行為止
+		if state == "collecting":
+			end_page = min(max_end_pg, pg)
+			end_marker = "eof_or_limit"
 
-	# 其他情況：持續加入行內容
-		collected.append(line)
-
-	# 若始終未命中結束條件：仍舊收集到頁數上限
-	if end_idx is None:
-		# Gather until max_end_pg
-		for idx in range(cursor, len(lines)):
-			pg, line = lines[idx]
-			if pg > max_end_pg:
-				break
-			collected.append(line)
-		end_page = min(max_end_pg, lines[-1][0])
-		end_marker = "eof_or_limit"
+	if state == "seeking":
+		return ExtractionResult(
+			abstract=None,
+			start_page=None,
+			end_page=None,
+			start_marker=None,
+			end_marker=None,
+			reason="Start marker not found",
+		)
 
-	# 修剪開頭與結尾的空白行
-	while collected and not collected[0].strip():
-		collected.pop(0)
-	while collected and not collected[-1].strip():
-		collected.pop()
+	# 修剪開頭與結尾的空白行（以索引定位後一次切片，避免反覆 pop(0)）
+	start = 0
+	end = len(collected)
+	while start < end and not collected[start].strip():
+		start += 1
+	while end > start and not collected[end - 1].strip():
+		end -= 1
 
 	# 移除結尾可能夾帶的頁碼/羅馬數字頁碼（常見於前置頁 ii、iii 等）
-	roman = re.compile(r"^[ivxlcdmIVXLCDM]{1,4}\.?$")
-	digits = re.compile(r"^\d{1,3}$")
-	while collected:
-		tail = collected[-1].strip()
-		if roman.match(tail) or digits.match(tail):
-			collected.pop()
+	while end > start:
+		tail = collected[end - 1].strip()
+		if _ROMAN_PAGE_RE.match(tail) or _DIGIT_PAGE_RE.match(tail):
+			end -= 1
 			continue
 		break
+	collected = collected[start:end]
 
 	text = _join_with_hyphen_fix(collected).strip()  # 修正英文連字號換行，保留換行
-	text = re.sub(r"\n{3,}", "\n\n", text)  # collapse excessive blank lines
+	text = _RE_BLANK_LINES.sub("\n\n", text)  # collapse excessive blank lines
 
 	if not text:
 		return ExtractionResult(
@@ -1036,16 +1229,177 @@ def extract_abstract_from_pdf(pdf_path: Path, verbose: bool = False) -> Extracti
 	)
 
 
-def process_path(input_path: Path, output_dir: Path, recursive: bool, verbose: bool, very_verbose: bool, to_csv:bool) -> int:
-	"""處理單一檔案或整個資料夾。回傳成功擷取的 PDF 數量。"""
+_gc_pending = 0
+
+
+def _after_pdf() -> None:
+	"""每個 PDF 處理完後的收尾：清空 MuPDF 累積的警告訊息，並在停用自動 GC 時定期手動回收。"""
+	global _gc_pending
+	if fitz is not None:
+		fitz.TOOLS.reset_mupdf_warnings()  # 警告會持續累積在記憶體中，批次處理時逐檔清除
+	if gc.isenabled():
+		return
+	_gc_pending += 1
+	if _gc_pending >= GC_COLLECT_EVERY:
+		_gc_pending = 0
+		gc.collect()
+
+
+def _init_worker() -> None:
+	"""ProcessPoolExecutor 子行程初始化：子行程只處理 PDF，整段停用自動 GC（由 _after_pdf 定期回收）。"""
+	gc.disable()
+
+
+def _load_cached(cache_file: Path) -> Optional[dict]:
+	"""讀取擷取結果快取；檔案不存在、損毀或版本不符時回傳 None。"""
+	try:
+		with open(cache_file, "rb") as f:
+			entry = json.load(f)
+	except (OSError, ValueError):
+		return None
+	if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+		return None
+	return entry
+
+
+def _store_cached(cache_file: Path, entry: dict, log: Callable[[str], None] = print) -> None:
+	"""寫入擷取結果快取：先寫暫存檔再以 os.replace 取代，避免中斷時留下不完整的 JSON。"""
+	tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+	try:
+		tmp.write_bytes(json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+		os.replace(tmp, cache_file)
+	except OSError as e:
+		# 快取僅為加速用途，寫入失敗不影響本次擷取結果
+		log(f"[WARN] Unable to write cache {cache_file}: {e}")
+		try:
+			tmp.unlink()
+		except OSError:
+			pass
+
+
+def _process_one(pdf: Path, txt_dir: Path, cache_dir: Optional[Path], verbose: bool, very_verbose: bool) -> Tuple[Optional[Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]], str]:
+	"""處理單一 PDF 並寫出其 .txt；回傳 ((title, year, author, abstract), log)。
+
+	未擷取到摘要時 abstract 為 None，發生錯誤時第一個元素為 None。
+	log 為該檔的 [AUTHOR]/[OK]/[MISS]/[ERROR] 等訊息，由 process_path 累積後一次輸出；
+	-vv 時改為即時輸出（log 為空字串），process_path 此時於主行程逐檔呼叫，追蹤訊息才不會與其他檔案交錯。
+
+	以檔名與 PDF 內容的雜湊查詢 cache_dir 中的擷取結果，兩者皆未變動時不再重跑 PyMuPDF 擷取（-vv 時不讀取快取）；
+	cache_dir 為 None 時不讀寫快取。
+	未命中快取時，以計算雜湊時讀入的內容開啟文件一次，題目/年分/作者與摘要擷取共用同一個 PdfLineCache，不會重複開檔或解析 xref。
+	定義於模組層級，才能交給 ProcessPoolExecutor 的子行程執行；子行程只接收檔案路徑並自行開檔（PyMuPDF 不支援多執行緒共用文件）。
+	"""
+	rel_name = pdf.stem
+	out_file = txt_dir / f"{rel_name}.txt"
+	log: List[str] = []
+
+	def _log(msg: str) -> None:
+		if very_verbose:
+			# -vv 的詳細訊息即時輸出，與擷取過程的追蹤訊息保持先後順序；
+			# 此順序僅在逐檔處理時成立，因此 process_path 在 -vv 時不使用行程池
+			print(msg)
+		else:
+			log.append(msg + "\n")
+
+	try:
+		data = pdf.read_bytes()
+		cache_file = None
+		if cache_dir is not None:
+			# 題目與年分會由檔名推斷，因此檔名也是快取鍵的一部分
+			h = hashlib.blake2b(pdf.name.encode("utf-8"), digest_size=16)
+			h.update(data)
+			cache_file = cache_dir / f"{h.hexdigest()}.json"
+		# -vv 用於觀察擷取過程的完整追蹤，因此不讀取快取，一律重新擷取（結果仍寫回快取）
+		entry = None if very_verbose or cache_file is None else _load_cached(cache_file)
+		if entry is None:
+			# 每個 PDF 只開啟一次，題目/作者與摘要共用已擷取的頁面文字
+			with PdfLineCache(pdf, data) as cache:
+				# 1) 題目/年分/作者
+				title, year, author, method = _extract_title_year_author(pdf, verbose=verbose, very_verbose=very_verbose, cache=cache, log=_log)
+
+				# 2) 摘要
+				# 僅在 -vv 時才顯示摘要起訖偵測的詳細訊息
+				result = extract_abstract_from_pdf(pdf, verbose=very_verbose, cache=cache)
+			del data
+			entry = {
+				"version": CACHE_VERSION,
+				"title": title,
+				"year": year,
+				"author": author,
+				"method": method,
+				# 需求格式：摘要作為單段落展示
+				"abstract_text": result.abstract.replace("\r", "").replace("\n", "") if result.abstract else None,
+				"start_page": result.start_page,
+				"end_page": result.end_page,
+				"reason": result.reason,
+			}
+			if cache_file is not None:
+				_store_cached(cache_file, entry, _log)
+		elif verbose:
+			# 命中快取時略過了作者擷取，依保存的來源補上與重新擷取時相同的 -v 作者訊息
+			_log(f"[AUTHOR] {entry['author'] or ''} ({entry['method'] or 'n/a'})")
+
+		title, year, author = entry["title"], entry["year"], entry["author"]
+		abstract_text = entry["abstract_text"]
+		if abstract_text:
+			# 3) 依指定格式輸出；段落以 os.linesep 分隔，與先前文字模式寫檔的換行一致
+			content = _TXT_PARAGRAPH_SEP.join([
+				f"題目：{title or ''}",
+				f"年分：{year or ''}",
+				f"作者：{author or ''}",
+				f"摘要：{abstract_text}",
+			])
+			with open(out_file, "wb", buffering=TXT_BUFFER_SIZE) as f:
+				f.write(UTF8_BOM)  # Windows 友善的 UTF-8 BOM
+				f.write(content.encode("utf-8"))
+			if verbose:
+				start_page = entry["start_page"] or 0
+				sp = start_page + 1
+				ep = (entry["end_page"] or start_page) + 1
+				_log("[OK] %s: abstract pages %d-%d, saved -> %s" % (pdf.name, sp, ep, out_file.name))
+		elif verbose:
+			_log("[MISS] %s: %s" % (pdf.name, entry["reason"] or "Unknown"))
+	except Exception as e:
+		_log("[ERROR] %s: %s" % (pdf, e))
+		return None, "".join(log)
+	finally:
+		_after_pdf()
+	return (title, year, author, abstract_text), "".join(log)
+
+
+def _iter_pdfs(root: Path, recursive: bool) -> Iterable[Path]:
+	"""以 os.scandir 列出資料夾內的 PDF（副檔名不分大小寫）；recursive 時一併掃描子資料夾（不跟隨符號連結，略過無權限者）。
+
+	DirEntry 的檔案類型取自讀取目錄時的結果，不必對每個項目另外 stat。
+	"""
+	stack = [root]
+	while stack:
+		d = stack.pop()
+		try:
+			it = os.scandir(d)
+		except PermissionError:
+			# 與 Path.rglob 相同，略過無法讀取的子資料夾
+			print(f"[WARN] Skipping unreadable directory: {d}")
+			continue
+		with it:
+			for entry in it:
+				if entry.is_dir(follow_symlinks=False):
+					if recursive:
+						stack.append(Path(entry.path))
+				elif entry.is_file() and entry.name.lower().endswith(".pdf"):
+					yield Path(entry.path)
+
+
+def process_path(input_path: Path, output_dir: Path, recursive: bool, verbose: bool, very_verbose: bool, to_csv:bool, use_cache: bool = True) -> int:
+	"""處理單一檔案或整個資料夾。回傳成功擷取的 PDF 數量。
+
+	use_cache：是否讀寫 <output-dir>/.cache 的擷取結果快取；快取檔不會自動清除，長時間執行的服務應關閉。
+	"""
 	pdf_files: List[Path]
 	if input_path.is_file() and input_path.suffix.lower() == ".pdf":
 		pdf_files = [input_path]
 	elif input_path.is_dir():
-		if recursive:
-			pdf_files = sorted(p for p in input_path.rglob("*.pdf"))
-		else:
-			pdf_files = sorted(p for p in input_path.glob("*.pdf"))
+		pdf_files = sorted(_iter_pdfs(input_path, recursive))
 	else:
 		print(f"[WARN] Skipping non-PDF path: {input_path}")
 		return 0
@@ -1053,63 +1407,96 @@ def process_path(input_path: Path, output_dir: Path, recursive: bool, verbose: b
 	output_dir.mkdir(parents=True, exist_ok=True)  # 確保輸出資料夾存在
 	txt_dir = output_dir / "txt"  # 將純文字輸出集中於子資料夾
 	txt_dir.mkdir(parents=True, exist_ok=True)
+	cache_dir = None
+	if use_cache:
+		cache_dir = output_dir / CACHE_DIR_NAME  # 依 PDF 內容雜湊保存擷取結果，重跑時略過未變動的檔案
+		cache_dir.mkdir(exist_ok=True)
 
 	success = 0
-	records: List[Tuple[str, str, str, str]] = []  # (title, year, author, abstract)
-	for pdf in pdf_files:
-		rel_name = pdf.stem
-		out_file = txt_dir / f"{rel_name}.txt"
-		try:
-			# 1) 題目/年分/作者
-			title, year, author = extract_title_year_author(pdf, verbose=verbose, very_verbose=very_verbose)
-
-			# 2) 摘要
-			# 僅在 -vv 時才顯示摘要起訖偵測的詳細訊息
-			result = extract_abstract_from_pdf(pdf, verbose=very_verbose)
-			if result.abstract:
-				# 需求格式：摘要作為單段落展示
-				abstract_text = result.abstract.replace("\r", "").replace("\n", "")
-
-				# 3) 依指定格式輸出
-				content = (
-					f"題目：{title or ''}\n\n"
-					f"年分：{year or ''}\n\n"
-					f"作者：{author or ''}\n\n"
-					f"摘要：{abstract_text}"
-				)
-				out_file.write_text(content, encoding="utf-8-sig")  # Windows 友善的 UTF-8 BOM
+	# 最後一個檔案的擷取結果（供 app 單檔呼叫使用）；擷取失敗的欄位維持 None
+	title = year = author = abstract_text = None
+	pool = None
+	if len(pdf_files) > 1 and not very_verbose:
+		# 多個 PDF 彼此獨立且為 CPU 密集，分散到多個行程處理；map 逐筆依輸入順序回傳，CSV 順序不變。
+		# -vv 的追蹤訊息由擷取過程即時輸出，多個行程同時輸出會交錯，因此 -vv 時改為逐檔依序處理
+		# 使用 ProcessPoolExecutor 而非 multiprocessing.Pool：子行程異常終止（MuPDF 當機、OOM）時
+		# 取結果會拋出 BrokenProcessPool，而不是讓整批處理無限期等待
+		workers = min(os.cpu_count() or 1, len(pdf_files))
+		chunksize = max(1, min(4, len(pdf_files) // workers))
+		pool = ProcessPoolExecutor(workers, initializer=_init_worker)
+		worker = partial(_process_one, txt_dir=txt_dir, cache_dir=cache_dir, verbose=verbose, very_verbose=very_verbose)
+		results: Iterable = pool.map(worker, pdf_files, chunksize=chunksize)
+	else:
+		results = (_process_one(pdf, txt_dir, cache_dir, verbose, very_verbose) for pdf in pdf_files)
+	if tqdm is not None and verbose and not very_verbose and len(pdf_files) > 1:
+		# 每完成一篇更新一次進度列；子行程不直接輸出，各檔訊息於批次結束、進度列關閉後一次輸出（-vv 逐檔即時輸出時不顯示進度列）
+		results = tqdm(results, total=len(pdf_files), unit="pdf")
+
+	def _csv_rows() -> Iterable[Tuple[str, str, str, str]]:
+		"""逐筆取出處理結果並計數；僅在輸出 CSV 時產出有摘要者的列，同時保留最後一個檔案的欄位。"""
+		nonlocal success, title, year, author, abstract_text
+		for res, log in results:
+			if log:
+				log_buf.append(log)
+			title, year, author, abstract_text = res or (None, None, None, None)
+			if abstract_text:
 				success += 1
-				records.append((title or "", year or "", author or "", abstract_text))
-				if verbose:
-					print(
-						f"[OK] {pdf.name}: abstract pages {(result.start_page or 0)+1}-"
-						f"{(result.end_page or result.start_page or 0)+1}, saved -> {out_file.name}"
-					)
-			else:
-				reason = result.reason or "Unknown"
-				if verbose:
-					print(f"[MISS] {pdf.name}: {reason}")
-		except Exception as e:
-			print(f"[ERROR] {pdf}: {e}")
-	# 寫出整併 CSV：論文整理.csv
-	if to_csv:
-		if records:
-			csv_path = output_dir / "論文整理.csv"
-			buf = io.StringIO()
-			# 使用單一換行符，避免 Windows 檢視器顯示空白列
-			writer = csv.writer(buf, lineterminator='\n')
-			writer.writerow(["題目", "年分", "作者", "摘要"])
-			for (title, year, author, abstract_text) in records:
-				writer.writerow([title, year, author, abstract_text])
-			csv_content = buf.getvalue()
-			buf.close()
+				if to_csv:
+					yield (title or "", year or "", author or "", abstract_text)
+
+	# 寫出整併 CSV：論文整理.csv；每完成一篇即寫入一列，不在記憶體中累積整批結果
+	csv_path = output_dir / "論文整理.csv"
+	# 先寫入暫存檔，完成後再以 os.replace 取代目標檔：中途失敗不會留下寫到一半的 CSV
+	tmp_path = csv_path.with_name(csv_path.name + ".tmp")
+	csv_file = None
+	completed = saved = False
+	log_buf: List[str] = []  # 各檔的 [AUTHOR]/[OK]/[MISS]/[ERROR] 訊息（依輸入順序），批次結束後一次寫出，避免逐檔 print
+	rows = _csv_rows()
+	# 批次期間大量短命物件（頁面文字、區塊 tuple）會反覆觸發 GC，暫停自動回收，結束後恢復
+	gc_was_enabled = gc.isenabled()
+	gc.disable()
+	try:
+		# 第一筆成功結果才建立檔案：沒有任何摘要（或不輸出 CSV）時不產生列，next 即已處理完所有檔案
+		first = next(rows, None)
+		if first is not None:
 			try:
-				csv_path.write_text(csv_content, encoding="utf-8-sig")
-				if verbose:
-					print(f"Saved CSV -> {csv_path} ({len(records)} rows)")
+				# 使用單一換行符，避免 Windows 檢視器顯示空白列
+				csv_file = open(tmp_path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE)
 			except PermissionError:
-				# 不產生其他檔名，維持目標名稱固定；提示使用者關閉檔案後重跑。
 				print(f"[WARN] Unable to write {csv_path} because it is open or locked. Please close it and rerun.")
+		if csv_file is not None:
+			# BOM 只在檔首寫一次（等同 utf-8-sig），之後各列以一般 UTF-8 編碼
+			csv_file.write("\ufeff")
+			writer = csv.writer(csv_file, lineterminator='\n')
+			writer.writerow(["題目", "年分", "作者", "摘要"])
+			writer.writerow(first)
+			# 其餘列交給 writerows，逐列迴圈在 C 層完成
+			writer.writerows(rows)
+		else:
+			for _ in rows:  # CSV 無法開啟時仍需處理完其餘檔案（輸出 .txt 與計數）
+				pass
+		completed = True
+	finally:
+		if pool is not None:
+			# 中途失敗（寫檔錯誤、Ctrl-C、子行程異常終止）時取消排隊中的其餘 PDF，只等待處理中的檔案
+			pool.shutdown(wait=True, cancel_futures=not completed)
+		if log_buf:
+			sys.stdout.write("".join(log_buf))
+		if csv_file is not None:
+			csv_file.close()
+			if completed:
+				try:
+					os.replace(tmp_path, csv_path)
+					saved = True
+				except PermissionError:
+					# 不產生其他檔名，維持目標名稱固定；提示使用者關閉檔案後重跑。
+					print(f"[WARN] Unable to write {csv_path} because it is open or locked. Please close it and rerun.")
+			if not saved:
+				tmp_path.unlink(missing_ok=True)
+		if gc_was_enabled:
+			gc.enable()
+	if saved and verbose:
+		print(f"Saved CSV -> {csv_path} ({success} rows)")
 
 	return success, title, year, author, abstract_text
 
@@ -1150,10 +1537,11 @@ def _inspect_pdf(pdf_path: Path, pages: int, max_lines: int) -> int:
 	doc = fitz.open(pdf_path)
 	try:
 		count = 0
-		for i in range(min(len(doc), max(1, pages))):
-			page = doc[i]
-			text = page.get_text("text").replace("\r\n", "\n").replace("\r", "\n")
-			for ln in text.split("\n"):
+		for i, page in enumerate(doc.pages(0, min(len(doc), max(1, pages)))):
+			# 與 PdfLineCache 相同使用預設 get_text 旗標，輸出即為擷取規則實際看到的文字；
+			# 改用 flags=0 等旗標雖略快，但會改變部分頁面的文字（連字、空白），失去除錯意義
+			# splitlines 一次處理 \n、\r\n、\r 等各種換行，不必先替換換行字元
+			for ln in page.get_text("text").splitlines():
 				print(f"{i+1:02d}: {ln}")
 				count += 1
 				if count >= max_lines:
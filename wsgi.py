@@ -0,0 +1,13 @@
+"""WSGI entry point for production servers.
+
+Example (Linux/macOS):
+    WEB_CONCURRENCY=2 gunicorn -k gthread --threads 16 --timeout 300 wsgi:app
+
+Each gunicorn worker owns its own PDF parsing pool, so keep the worker count
+small and scale with --threads. gunicorn reads WEB_CONCURRENCY as its worker
+count, and app.py divides the CPU cores among that many pools (override the
+per-worker pool size with PDF_POOL_WORKERS).
+"""
+from app import app
+
+__all__ = ['app']